@@ -0,0 +1,14 @@
+"""
+Aethos calculator benchmarks (offline, deterministic).
+
+Run from the repository root:
+  python -m benchmarks.run --sizes 1,1k --baseline benchmarks/baseline.json
+"""
+
+import sys
+from pathlib import Path
+
+# The calculators are not packaged yet; benchmark straight from the source tree.
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
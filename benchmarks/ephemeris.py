@@ -0,0 +1,131 @@
+"""
+ephemeris.py — deterministic offline ephemeris stand-in (benchmarks only).
+
+Purpose:
+- Give the calculators something to call when Swiss Ephemeris is absent.
+- Geocentric ecliptic longitudes from Keplerian mean elements
+  (Standish, "Approximate Positions of the Planets", 1800–2050 table) plus a
+  one-term lunar theory. Good to a few arcminutes for the planets and ~1° for
+  the Moon: realistic motion (retrogrades, speeds), NOT production accuracy.
+- Angles (Asc/MC) from mean sidereal time and a fixed obliquity.
+
+Every evaluation is counted in CALLS so benchmarks can report ephemeris load.
+"""
+
+from __future__ import annotations
+
+from math import atan2, cos, degrees, radians, sin, sqrt, tan
+from typing import Dict, Mapping, Tuple
+
+J2000_JD = 2451545.0
+OBLIQUITY_DEG = 23.4392911
+
+# body -> (a, e, I, L, long.peri, long.node) at J2000 and rates per Julian century
+_ELEMENTS: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = {
+    "Mercury": ((0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+                (0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081)),
+    "Venus": ((0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+              (0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418)),
+    "EMB": ((1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+            (0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0)),
+    "Mars": ((1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+             (0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343)),
+    "Jupiter": ((5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909),
+                (-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106)),
+    "Saturn": ((9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448),
+               (-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794)),
+    "Uranus": ((19.18916464, 0.04725744, 0.77263783, 313.23810451, 170.95427630, 74.01692503),
+               (-0.00196176, -0.00004397, -0.00242939, 428.48202785, 0.40805281, 0.04240589)),
+    "Neptune": ((30.06992276, 0.00859048, 1.77004347, -55.12002969, 44.96476227, 131.78422574),
+                (0.00026291, 0.00005105, 0.00035372, 218.45945325, -0.32241464, -0.00508664)),
+    "Pluto": ((39.48211675, 0.24882730, 17.14001206, 238.92903833, 224.06891629, 110.30393684),
+              (-0.00031596, 0.00005170, 0.00004818, 145.20780515, -0.04062942, -0.01183482)),
+}
+
+BODIES: Tuple[str, ...] = (
+    "Sun", "Moon", "Mercury", "Venus", "Mars",
+    "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto",
+)
+
+SPEED_STEP_DAYS = 0.01
+
+CALLS: Dict[str, int] = {"lon": 0}
+
+
+def reset_counters() -> None:
+    for k in CALLS:
+        CALLS[k] = 0
+
+
+def _heliocentric(name: str, jd: float) -> Tuple[float, float, float]:
+    base, rate = _ELEMENTS[name]
+    t = (jd - J2000_JD) / 36525.0
+    a, e, inc, mean_lon, peri, node = (b + r * t for b, r in zip(base, rate))
+
+    m = radians((mean_lon - peri) % 360.0)
+    ecc = m + e * sin(m)
+    for _ in range(6):  # Newton on Kepler's equation
+        ecc -= (ecc - e * sin(ecc) - m) / (1.0 - e * cos(ecc))
+
+    xp = a * (cos(ecc) - e)
+    yp = a * sqrt(1.0 - e * e) * sin(ecc)
+    w = radians(peri - node)
+    o = radians(node)
+    i = radians(inc)
+    cw, sw, co, so, ci = cos(w), sin(w), cos(o), sin(o), cos(i)
+    x = (cw * co - sw * so * ci) * xp + (-sw * co - cw * so * ci) * yp
+    y = (cw * so + sw * co * ci) * xp + (-sw * so + cw * co * ci) * yp
+    z = (sw * sin(i)) * xp + (cw * sin(i)) * yp
+    return x, y, z
+
+
+def _moon_lon(jd: float) -> float:
+    d = jd - J2000_JD
+    mean_lon = 218.316 + 13.176396 * d
+    anomaly = radians(134.963 + 13.064993 * d)
+    return mean_lon + 6.289 * sin(anomaly)
+
+
+def body_lon(body: str, jd: float) -> float:
+    """Geocentric ecliptic longitude in degrees [0, 360)."""
+    CALLS["lon"] += 1
+    if body == "Moon":
+        return _moon_lon(jd) % 360.0
+    ex, ey, _ = _heliocentric("EMB", jd)
+    if body == "Sun":
+        return degrees(atan2(-ey, -ex)) % 360.0
+    if body == "Earth":  # HD convention: opposite the Sun
+        return degrees(atan2(ey, ex)) % 360.0
+    px, py, _ = _heliocentric(body, jd)
+    return degrees(atan2(py - ey, px - ex)) % 360.0
+
+
+def body_speed(body: str, jd: float) -> float:
+    """Degrees/day by central difference (negative = retrograde)."""
+    a = body_lon(body, jd - SPEED_STEP_DAYS)
+    b = body_lon(body, jd + SPEED_STEP_DAYS)
+    d = (b - a) % 360.0
+    if d > 180.0:
+        d -= 360.0
+    return d / (2.0 * SPEED_STEP_DAYS)
+
+
+def sun_lon_at(jd: float) -> float:
+    return body_lon("Sun", jd)
+
+
+def positions_at(jd: float, bodies: Tuple[str, ...] = BODIES) -> Dict[str, float]:
+    return {b: body_lon(b, jd) for b in bodies}
+
+
+def angles_at(jd: float, lat: float, lon: float) -> Dict[str, float]:
+    """Asc/MC/Desc/IC from mean sidereal time (east longitude positive)."""
+    lst = radians((280.46061837 + 360.98564736629 * (jd - J2000_JD) + lon) % 360.0)
+    eps = radians(OBLIQUITY_DEG)
+    mc = degrees(atan2(sin(lst), cos(lst) * cos(eps))) % 360.0
+    asc = degrees(atan2(cos(lst), -(sin(lst) * cos(eps) + tan(radians(lat)) * sin(eps)))) % 360.0
+    return {"Asc": asc, "MC": mc, "Desc": (asc + 180.0) % 360.0, "IC": (mc + 180.0) % 360.0}
+
+
+def natal_chart(jd: float, lat: float, lon: float) -> Mapping[str, float]:
+    return {**positions_at(jd), **angles_at(jd, lat, lon)}
@@ -0,0 +1,100 @@
+"""
+fixtures.py — generated, deterministic benchmark profiles.
+
+Profiles follow the shape timing_events.load_profile() expects:
+  profile_id, canonical_chart.meta (tz_name, lat, lon),
+  canonical_chart.western_tropical.points (planets + Asc/MC/Desc/IC).
+
+Sizes: "1", "1k", "1m" (or any integer). Profiles are yielded lazily, so the
+1M set never lives in memory at once.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterator, List, Tuple
+
+from . import ephemeris
+
+SEED = 20260214
+
+SIZES: Dict[str, int] = {"1": 1, "1k": 1_000, "1m": 1_000_000}
+
+# (tz_name, lat, lon) — a spread of hemispheres and offsets.
+CITIES: Tuple[Tuple[str, float, float], ...] = (
+    ("America/Detroit", 42.3314, -83.0458),
+    ("America/Los_Angeles", 34.0522, -118.2437),
+    ("Europe/London", 51.5072, -0.1276),
+    ("Europe/Berlin", 52.5200, 13.4050),
+    ("Asia/Kolkata", 19.0760, 72.8777),
+    ("Asia/Tokyo", 35.6762, 139.6503),
+    ("Australia/Sydney", -33.8688, 151.2093),
+    ("America/Sao_Paulo", -23.5505, -46.6333),
+)
+
+# Birth dates between 1950-01-01 and 2010-01-01.
+_JD_MIN = 2433282.5
+_JD_MAX = 2455197.5
+
+# HD mandala order starting at Gate 41 (2° Aquarius). Stand-in only: the real
+# table must be verified before it goes into human_design.GATE_START_DEG.
+STANDIN_GATE_ORDER: Tuple[int, ...] = (
+    41, 19, 13, 49, 30, 55, 37, 63, 22, 36, 25, 17, 21, 51, 42, 3,
+    27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15, 52, 39, 53, 62, 56,
+    31, 33, 7, 4, 29, 59, 40, 64, 47, 6, 46, 18, 48, 57, 32, 50,
+    28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10, 58, 38, 54, 61, 60,
+)
+STANDIN_GATE_41_START = 302.0
+
+
+def parse_size(label: str) -> int:
+    if label in SIZES:
+        return SIZES[label]
+    return int(label)
+
+
+def standin_gate_start_deg() -> Dict[int, float]:
+    return {
+        gate: (STANDIN_GATE_41_START + i * 5.625) % 360.0
+        for i, gate in enumerate(STANDIN_GATE_ORDER)
+    }
+
+
+def install_standin_gate_wheel() -> None:
+    """Populate human_design.GATE_START_DEG in this process if it is still empty."""
+    from aethos.calculators import human_design
+
+    if len(human_design.GATE_START_DEG) < 64:
+        human_design.set_gate_wheel(standin_gate_start_deg())
+
+
+def make_profile(i: int, rnd: random.Random) -> Dict[str, Any]:
+    tz_name, lat, lon = CITIES[rnd.randrange(len(CITIES))]
+    jd = rnd.uniform(_JD_MIN, _JD_MAX)
+    chart = ephemeris.natal_chart(jd, lat, lon)
+    return {
+        "profile_id": f"bench-{i:07d}",
+        "canonical_chart": {
+            "meta": {"tz_name": tz_name, "lat": lat, "lon": lon, "jd_ut": jd},
+            "western_tropical": {
+                "engine_version": "bench-standin",
+                "settings": {"zodiac": "tropical", "house_system": "whole_sign"},
+                "points": {name: {"lon": v} for name, v in chart.items()},
+            },
+        },
+    }
+
+
+def generate_profiles(n: int, seed: int = SEED) -> Iterator[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    for i in range(n):
+        yield make_profile(i, rnd)
+
+
+def profile_list(n: int, seed: int = SEED) -> List[Dict[str, Any]]:
+    return list(generate_profiles(n, seed))
+
+
+def random_lons(n: int, seed: int = SEED) -> List[float]:
+    rnd = random.Random(seed)
+    return [rnd.uniform(0.0, 360.0) for _ in range(n)]
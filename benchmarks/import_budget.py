@@ -0,0 +1,137 @@
+"""
+import_budget.py — cold-start import budget for the calculators package.
+
+Each module is imported in a fresh interpreter under `python -X importtime`.
+The budget applies to aethos-owned time: the self time of every aethos.*
+module in the import tree (best of --repeat cold starts). Stdlib time the
+module genuinely needs (typing, dataclasses) is reported but not budgeted,
+since it dominates on a cold interpreter and varies by machine. None of the
+modules listed as deferred may be loaded as a side effect of the import.
+
+Usage:
+  python -m benchmarks.import_budget
+  python -m benchmarks.import_budget --repeat 9 --scale 2.0   # slow CI box
+
+Exits with status 1 when any budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Loaded on first use only — never by importing a calculator module.
+DEFERRED_MODULES: Tuple[str, ...] = ("swisseph", "zoneinfo", "logging", "tempfile")
+
+
+@dataclass(frozen=True)
+class Budget:
+    module: str
+    max_ms: float
+    must_not_load: Tuple[str, ...] = DEFERRED_MODULES
+
+
+BUDGETS: Tuple[Budget, ...] = (
+    Budget(
+        "aethos.calculators",
+        max_ms=4.0,
+        must_not_load=DEFERRED_MODULES + (
+            "typing",
+            "aethos.calculators.gene_keys",
+            "aethos.calculators.human_design",
+            "aethos.calculators.vedic_sidereal",
+        ),
+    ),
+    Budget("aethos.calculators.instrumentation", max_ms=10.0),
+    Budget("aethos.calculators.gene_keys", max_ms=15.0),
+    Budget("aethos.calculators.human_design", max_ms=15.0),
+    Budget("aethos.calculators.vedic_sidereal", max_ms=15.0),
+    Budget("aethos.calculators.canonical_output", max_ms=15.0),
+    Budget("aethos.calculators.canonical_chart", max_ms=15.0),
+)
+
+_PROBE = "import sys, {module}; sys.stdout.write('\\n'.join(sys.modules))"
+
+
+def measure(module: str) -> Tuple[float, float, List[str]]:
+    """One cold import: (cumulative ms, aethos-owned ms, modules loaded afterwards)."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative_us: Optional[int] = None
+    own_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, _, rest = line.partition(":")
+        fields = [f.strip() for f in rest.split("|")]
+        if len(fields) != 3 or not fields[0].isdigit():
+            continue  # header row
+        name = fields[2]
+        if name == "aethos" or name.startswith("aethos."):
+            own_us += int(fields[0])
+        if name == module:
+            cumulative_us = int(fields[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"no importtime record for {module} (already imported by site?)")
+    return cumulative_us / 1000.0, own_us / 1000.0, proc.stdout.split("\n")
+
+
+def check(budget: Budget, repeat: int, scale: float) -> Dict[str, object]:
+    best_total = best_own = float("inf")
+    loaded: List[str] = []
+    for _ in range(repeat):
+        total, own, loaded = measure(budget.module)
+        best_total = min(best_total, total)
+        best_own = min(best_own, own)
+    leaked = sorted(m for m in budget.must_not_load if m in loaded)
+    limit = budget.max_ms * scale
+    return {
+        "module": budget.module,
+        "total_ms": round(best_total, 3),
+        "own_ms": round(best_own, 3),
+        "budget_ms": round(limit, 3),
+        "leaked": leaked,
+        "ok": best_own <= limit and not leaked,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Aethos calculators import-time budget")
+    ap.add_argument("--repeat", type=int, default=5, help="cold starts per module (best is kept)")
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow machines)")
+    ap.add_argument("--out", help="write results JSON here")
+    args = ap.parse_args(argv)
+
+    rows = [check(b, args.repeat, args.scale) for b in BUDGETS]
+
+    print(f"{'module':<38} {'total_ms':>9} {'own_ms':>8} {'budget':>7}  status")
+    for r in rows:
+        status = "ok" if r["ok"] else "loads " + ",".join(r["leaked"]) if r["leaked"] else "OVER"
+        print(f"{r['module']:<38} {r['total_ms']:>9.2f} {r['own_ms']:>8.2f} {r['budget_ms']:>7.1f}  {status}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"results": rows}, f, indent=2)
+            f.write("\n")
+
+    if not all(r["ok"] for r in rows):
+        print("import budget exceeded", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+scenarios.py — micro and end-to-end benchmark scenarios.
+
+Each scenario has a setup(n) that builds fixtures for n profiles (outside the
+timed region) and returns the callable that is timed. Results are reported
+per profile (per item for array scenarios).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import random
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+from . import ephemeris, fixtures, transits_standin
+
+transits_standin.install()
+
+from aethos.calculators import canonical_output, gene_keys, human_design, vedic_sidereal  # noqa: E402
+from aethos.calculators.canonical_chart import BirthInput, compute_canonical_chart  # noqa: E402
+from aethos.jobs import reversion, store  # noqa: E402
+from aethos.src.aethos.calculators import notification_scheduler, timing_codec, timing_events, transit_search  # noqa: E402
+
+fixtures.install_standin_gate_wheel()
+
+BENCH_DAY = datetime(2026, 2, 14)
+HD_POINTS = ("Sun", "Earth", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    kind: str                                   # micro | e2e
+    setup: Callable[[int], Callable[[], None]]
+    max_size: int
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, kind: str, max_size: int) -> Callable:
+    def register(setup: Callable[[int], Callable[[], None]]) -> Callable[[int], Callable[[], None]]:
+        SCENARIOS[name] = Scenario(name=name, kind=kind, setup=setup, max_size=max_size)
+        return setup
+    return register
+
+
+def _each(fn: Callable, items: List) -> Callable[[], None]:
+    def run() -> None:
+        for item in items:
+            fn(item)
+    return run
+
+
+def _scratch_dir() -> str:
+    """Temp dir for on-disk fixtures, removed when the runner exits."""
+    path = tempfile.mkdtemp(prefix="aethos-bench-")
+    atexit.register(shutil.rmtree, path, True)
+    return path
+
+
+def _hd_positions(points: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    pos = {k: points[k]["lon"] for k in HD_POINTS if k in points}
+    pos["Earth"] = (pos["Sun"] + 180.0) % 360.0
+    return pos
+
+
+def _frame() -> "transits_standin.TransitFrame":
+    return transits_standin.compute_transits_frame(
+        dt_local=BENCH_DAY.replace(hour=9), tz_name="America/Detroit", lat=42.3314, lon=-83.0458
+    )
+
+
+# ---------------------------------------------------------------------------
+# Micro
+# ---------------------------------------------------------------------------
+
+@scenario("lon_to_gate", "micro", max_size=1_000_000)
+def _lon_to_gate(n: int) -> Callable[[], None]:
+    lons = fixtures.random_lons(n)
+    return _each(human_design.lon_to_gate, lons)
+
+
+@scenario("solve_design_jd", "micro", max_size=1_000)
+def _solve_design_jd(n: int) -> Callable[[], None]:
+    jds = [p["canonical_chart"]["meta"]["jd_ut"] for p in fixtures.generate_profiles(n)]
+    return _each(lambda jd: human_design.solve_design_jd(jd, ephemeris.sun_lon_at), jds)
+
+
+@scenario("find_transit_aspects", "micro", max_size=1_000)
+def _find_transit_aspects(n: int) -> Callable[[], None]:
+    frame = _frame()
+    natals = [timing_events.natal_points_from_profile(p) for p in fixtures.generate_profiles(n)]
+    return _each(lambda natal: timing_events.find_transit_aspects(natal, natal["Asc"], frame), natals)
+
+
+@scenario("solve_angle_crossing", "micro", max_size=1_000)
+def _solve_angle_crossing(n: int) -> Callable[[], None]:
+    t0 = BENCH_DAY
+    t1 = BENCH_DAY + timedelta(days=1)
+    moon0 = _frame().tropical["Moon"]["lon"]
+    rnd = random.Random(fixtures.SEED)
+    targets = [(moon0 + rnd.uniform(-2.0, 10.0)) % 360.0 for _ in range(n)]
+
+    def run() -> None:
+        for target in targets:
+            timing_events.solve_angle_crossing(
+                "Moon", "Asc", target, "America/Detroit", 42.3314, -83.0458, t0, t1
+            )
+    return run
+
+
+SEARCH_SPAN_DAYS = 30 * 365.25
+
+
+@scenario("transit_search_saturn_30y", "micro", max_size=1_000)
+def _transit_search_single(n: int) -> Callable[[], None]:
+    t0 = notification_scheduler.to_jd(BENCH_DAY)
+    natals = [{"Sun": timing_events.natal_points_from_profile(p)["Sun"]} for p in fixtures.generate_profiles(n)]
+    return _each(
+        lambda natal: transit_search.search_transits(
+            ephemeris.body_lon, "Saturn", natal, t0, t0 + SEARCH_SPAN_DAYS, aspects=("square",)
+        ),
+        natals,
+    )
+
+
+@scenario("transit_search_cohort_30y", "micro", max_size=1_000)
+def _transit_search_cohort(n: int) -> Callable[[], None]:
+    t0 = notification_scheduler.to_jd(BENCH_DAY)
+    cohort = {
+        p["profile_id"]: {"Jupiter": timing_events.natal_points_from_profile(p)["Jupiter"]}
+        for p in fixtures.generate_profiles(n)
+    }
+    return lambda: transit_search.search_cohort(
+        ephemeris.body_lon, "Jupiter", cohort, t0, t0 + SEARCH_SPAN_DAYS, aspects=("conj",)
+    )
+
+
+@scenario("compute_gene_keys_layer", "micro", max_size=1_000)
+def _gene_keys_layer(n: int) -> Callable[[], None]:
+    layers = [
+        {k: {"gate": g} for k, g in zip(HD_POINTS, row)}
+        for row in _gate_rows(n)
+    ]
+    return _each(gene_keys.compute_gene_keys_layer, layers)
+
+
+@scenario("gene_keys_batch_columns", "micro", max_size=1_000_000)
+def _gene_keys_batch(n: int) -> Callable[[], None]:
+    rows = _gate_rows(n)
+    return lambda: gene_keys.gene_keys_batch_from_columns(HD_POINTS, rows).expand(0)
+
+
+def _gate_rows(n: int) -> List[List[int]]:
+    rnd = random.Random(fixtures.SEED)
+    return [[rnd.randint(1, 64) for _ in HD_POINTS] for _ in range(n)]
+
+
+@scenario("sidereal_lons_batch", "micro", max_size=1_000_000)
+def _sidereal_batch(n: int) -> Callable[[], None]:
+    rnd = random.Random(fixtures.SEED)
+    jds = [rnd.uniform(2433282.5, 2455197.5) for _ in range(n)]
+    lons = fixtures.random_lons(n)
+    series = vedic_sidereal.AyanamsaSeries(vedic_sidereal.lahiri_ayanamsa_polynomial)
+
+    def run() -> None:
+        sid = vedic_sidereal.sidereal_lons_batch(jds, lons, ayanamsa=series)
+        vedic_sidereal.nakshatra_pada_batch(sid)
+    return run
+
+
+def _year_of_bundles(n: int) -> List[List[dict]]:
+    return [timing_codec._synthetic_year(profile_id=f"bench-{i:07d}") for i in range(n)]
+
+
+@scenario("timing_codec_encode_year", "micro", max_size=1)
+def _codec_encode(n: int) -> Callable[[], None]:
+    years = _year_of_bundles(n)
+    return _each(timing_codec.encode_timing_series, years)
+
+
+def _check_codec_round_trip(days: List[dict]) -> None:
+    """Fail setup unless every frame and series of `days` decodes back to the input."""
+    for prev, bundle in zip([None] + days[:-1], days):
+        if timing_codec.decode_timing_bundle(timing_codec.encode_timing_bundle(bundle, prev), prev) != bundle:
+            raise AssertionError(f"timing_codec frame round-trip mismatch on {bundle['date_local']}")
+    for interval in (0, 1, 3, 32):
+        blob = timing_codec.encode_timing_series(days, keyframe_interval=interval)
+        if timing_codec.decode_timing_series(blob) != days:
+            raise AssertionError(f"timing_codec series round-trip mismatch (keyframe_interval={interval})")
+        for lo, hi in ((0, 0), (2, 5), (len(days) // 2, len(days) + 3), (len(days) - 1, len(days) - 1)):
+            start, end = (date.fromisoformat(days[0]["date_local"]) + timedelta(days=d) for d in (lo, hi))
+            if timing_codec.decode_timing_series_range(blob, start, end) != days[lo:hi + 1]:
+                raise AssertionError(f"timing_codec range read mismatch (keyframe_interval={interval}, days {lo}-{hi})")
+
+
+@scenario("timing_codec_decode_year", "micro", max_size=1)
+def _codec_decode(n: int) -> Callable[[], None]:
+    years = _year_of_bundles(n)
+    for days in years + [timing_codec._edge_case_days()]:
+        _check_codec_round_trip(days)
+    blobs = [timing_codec.encode_timing_series(y) for y in years]
+    return _each(timing_codec.decode_timing_series, blobs)
+
+
+@scenario("timing_codec_decode_range", "micro", max_size=1_000)
+def _codec_decode_range(n: int) -> Callable[[], None]:
+    # Days 300-330 of a stored year: starts at the nearest keyframe, not frame 0.
+    blob = timing_codec.encode_timing_series(timing_codec._synthetic_year())
+    start = date(2026, 1, 1) + timedelta(days=300)
+    end = start + timedelta(days=30)
+    return _each(lambda b: timing_codec.decode_timing_series_range(b, start, end), [blob] * n)
+
+
+@scenario("canonical_dumps_bundle", "micro", max_size=1_000)
+def _canonical_dumps(n: int) -> Callable[[], None]:
+    bundles = timing_codec._synthetic_year(days=max(n, 1))[:n]
+    return _each(canonical_output.canonicalize, bundles)
+
+
+# ---------------------------------------------------------------------------
+# End-to-end
+# ---------------------------------------------------------------------------
+
+@scenario("build_daily_timing_events", "e2e", max_size=1_000)
+def _daily_bundle(n: int) -> Callable[[], None]:
+    tmp = _scratch_dir()
+    paths = []
+    for p in fixtures.generate_profiles(n):
+        path = os.path.join(tmp, f"{p['profile_id']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(p, f)
+        paths.append(path)
+    return _each(lambda path: timing_events.build_daily_timing_events(path, BENCH_DAY), paths)
+
+
+@scenario("notification_scheduler_day", "e2e", max_size=1_000)
+def _notification_day(n: int) -> Callable[[], None]:
+    profiles = fixtures.profile_list(n)
+    start = BENCH_DAY.replace(hour=9)
+
+    def run() -> None:
+        sched = notification_scheduler.NotificationScheduler(ephemeris.positions_at)
+        for p in profiles:
+            sched.add_profile(p)
+        for hour in range(25):
+            sched.pop_due(start + timedelta(hours=hour))
+    return run
+
+
+@scenario("profile_build", "e2e", max_size=1_000)
+def _profile_build(n: int) -> Callable[[], None]:
+    profiles = fixtures.profile_list(n)
+    series = vedic_sidereal.AyanamsaSeries(vedic_sidereal.lahiri_ayanamsa_polynomial)
+
+    def run() -> None:
+        for p in profiles:
+            meta = p["canonical_chart"]["meta"]
+            western = p["canonical_chart"]["western_tropical"]
+            compute_canonical_chart(BirthInput("1990-01-01T12:00:00", meta["tz_name"], meta["lat"], meta["lon"]))
+            hd = human_design.compute_human_design_layer(
+                birth_jd_ut=meta["jd_ut"],
+                positions_birth=_hd_positions(western["points"]),
+                sun_lon_at=ephemeris.sun_lon_at,
+                compute_positions_at_jd=lambda jd: _hd_positions(
+                    {k: {"lon": v} for k, v in ephemeris.positions_at(jd).items()}
+                ),
+            )
+            gene_keys.compute_gene_keys_layer(hd["personality"]["activations"])
+            gene_keys.compute_gene_keys_layer(hd["design"]["activations"])
+            vedic_sidereal.compute_vedic_sidereal_layer(western, jd_ut=meta["jd_ut"], ayanamsa=series)
+    return run
+
+
+@scenario("reversion_job", "e2e", max_size=1_000)
+def _reversion_job(n: int) -> Callable[[], None]:
+    path = os.path.join(_scratch_dir(), "profiles.sqlite")
+    conn = store.connect(path)
+    with conn:
+        store.insert_birth_profiles(conn, (
+            {
+                "profile_id": p["profile_id"],
+                "local_datetime": "1990-01-01T12:00:00",
+                "tzid": p["canonical_chart"]["meta"]["tz_name"],
+                "lat": p["canonical_chart"]["meta"]["lat"],
+                "lon": p["canonical_chart"]["meta"]["lon"],
+                "julian_day_ut": p["canonical_chart"]["meta"]["jd_ut"],
+            }
+            for p in fixtures.generate_profiles(n)
+        ))
+    conn.close()
+    eph = reversion.Ephemeris.from_module(ephemeris.__name__)
+    # Stored payloads exist after the warm-up run; timed runs force every layer
+    # in-process so the number is per-profile pipeline + diff + write cost.
+    return lambda: reversion.run_reversion(
+        path, ephemeris=eph, workers=1, force=reversion.SYSTEMS, on_progress=None
+    )
@@ -0,0 +1,127 @@
+"""
+transits_standin.py — offline stand-in for the missing transits_engine module.
+
+timing_events.py imports `.transits_engine`; benchmarks install this module in
+its place (install()) so the timing hot paths run without Swiss Ephemeris.
+Only the names timing_events uses are provided.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from . import ephemeris
+
+TARGET_MODULE = "aethos.src.aethos.calculators.transits_engine"
+
+PLANETS = ephemeris.BODIES
+
+ASPECTS: Dict[str, float] = {
+    "conj": 0.0,
+    "opp": 180.0,
+    "square": 90.0,
+    "trine": 120.0,
+    "sextile": 60.0,
+}
+
+ASPECT_SYMBOL: Dict[str, str] = {
+    "conj": "☌",
+    "opp": "☍",
+    "square": "□",
+    "trine": "△",
+    "sextile": "⚹",
+}
+
+_UNIX_EPOCH_JD = 2440587.5
+
+
+def normalize_deg(lon: float) -> float:
+    lon = lon % 360.0
+    return lon + 360.0 if lon < 0 else lon
+
+
+def whole_sign_house(asc_lon: float, lon: float) -> int:
+    return (int(normalize_deg(lon) // 30) - int(normalize_deg(asc_lon) // 30)) % 12 + 1
+
+
+@dataclass(frozen=True)
+class TransitFrame:
+    jd_ut: float
+    dt_utc_iso: str
+    dt_local_iso: str
+    tropical: Dict[str, Dict[str, float]]
+    angles: Dict[str, Dict[str, float]]
+    sidereal: Optional[Dict[str, Dict[str, float]]] = None
+
+
+def datetime_to_jd(dt_utc: datetime) -> float:
+    return dt_utc.timestamp() / 86400.0 + _UNIX_EPOCH_JD
+
+
+def compute_transits_frame(
+    *,
+    dt_local: datetime,
+    tz_name: str,
+    lat: float,
+    lon: float,
+    include_sidereal: bool = False,
+    angles_house_system: bytes = b"P",
+) -> TransitFrame:
+    aware = dt_local if dt_local.tzinfo else dt_local.replace(tzinfo=ZoneInfo(tz_name))
+    dt_utc = aware.astimezone(timezone.utc)
+    jd = datetime_to_jd(dt_utc)
+
+    tropical = {
+        b: {"lon": ephemeris.body_lon(b, jd), "speed": ephemeris.body_speed(b, jd)}
+        for b in PLANETS
+    }
+    angles = {k: {"lon": v} for k, v in ephemeris.angles_at(jd, lat, lon).items()}
+
+    sidereal = None
+    if include_sidereal:
+        from aethos.calculators.vedic_sidereal import to_sidereal
+        sidereal = {b: {"lon": to_sidereal(v["lon"], jd)} for b, v in tropical.items()}
+
+    return TransitFrame(
+        jd_ut=jd,
+        dt_utc_iso=dt_utc.isoformat().replace("+00:00", "Z"),
+        dt_local_iso=aware.isoformat(),
+        tropical=tropical,
+        angles=angles,
+        sidereal=sidereal,
+    )
+
+
+def compute_daily_frames(
+    *,
+    day_local: datetime,
+    tz_name: str,
+    lat: float,
+    lon: float,
+    step_minutes: int = 60,
+    **kwargs: Any,
+) -> List[TransitFrame]:
+    start = day_local.replace(hour=0, minute=0, second=0, microsecond=0)
+    steps = (24 * 60) // step_minutes
+    return [
+        compute_transits_frame(
+            dt_local=start + timedelta(minutes=i * step_minutes), tz_name=tz_name, lat=lat, lon=lon, **kwargs
+        )
+        for i in range(steps + 1)
+    ]
+
+
+def install() -> None:
+    """Register this module as aethos...calculators.transits_engine (no-op if a real one imports)."""
+    if TARGET_MODULE in sys.modules:
+        return
+    try:
+        __import__(TARGET_MODULE)
+        return
+    except ImportError:
+        pass
+    sys.modules[TARGET_MODULE] = sys.modules[__name__]
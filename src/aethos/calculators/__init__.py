@@ -6,8 +6,41 @@ Calculation Layer
 
 Deterministic computational modules:
 - astrology (Swiss Ephemeris wrapper)
+- vedic sidereal (derived from tropical points + ayanamsa table)
 - human design
 - gene keys
 - numerology
 - bazi
+- canonical output (serializer, content hashes, response cache)
+- instrumentation (opt-in spans, counters, metric sinks)
+
+Loading:
+- Importing this package imports no calculator. Submodules load on first
+  attribute access (aethos.calculators.gene_keys) or explicit import, and
+  lookup tables / ephemeris sources load on first use inside each module.
+  A worker that only serves Gene Keys lookups never pays for the rest.
 """
+
+import importlib
+
+_SUBMODULES = (
+    "canonical_chart",
+    "canonical_output",
+    "gene_keys",
+    "human_design",
+    "instrumentation",
+    "vedic_sidereal",
+)
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        # import_module binds the submodule on this package, so this runs once per name.
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -16,6 +16,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional, Mapping
 from datetime import datetime, timezone
 
+from .instrumentation import timed
+
+ENGINE_VERSION = "0.1.0-scaffold"
+
 
 @dataclass(frozen=True)
 class BirthInput:
@@ -27,6 +31,7 @@ class BirthInput:
     birth_time_confidence: str = "exact"  # exact|approx|unknown
 
 
+@timed("canonicalize")
 def build_canonical_birth_profile(birth: BirthInput) -> Dict[str, Any]:
     """
     Convert local datetime + timezone into UTC datetime and JD UT.
@@ -53,6 +58,7 @@ def build_canonical_birth_profile(birth: BirthInput) -> Dict[str, Any]:
     }
 
 
+@timed("western_points")
 def compute_western_tropical_points(
     *,
     jd_ut: float,
@@ -84,7 +90,7 @@ def compute_western_tropical_points(
     angles = {"Asc": {"lon": None}, "MC": {"lon": None}, "Desc": {"lon": None}, "IC": {"lon": None}}
 
     return {
-        "engine_version": "0.1.0-scaffold",
+        "engine_version": ENGINE_VERSION,
         "settings": {"zodiac": "tropical", "house_system": house_system},
         "angles": angles,
         "points": points,
@@ -0,0 +1,257 @@
+"""
+canonical_output.py — Aethos V1 (Scaffold)
+
+Purpose:
+- Serialize calculator outputs deterministically ("same input → same output"):
+  - keys sorted, no whitespace, UTF-8
+  - floats in fixed-decimal form (no exponent, no -0, no NaN/Infinity)
+- Derive a content hash from those exact bytes (golden hashes, ETags).
+- Cache serialized responses by request key so conditional requests
+  (If-None-Match → 304) skip re-serialization and recomputation.
+
+Integration:
+- API handlers for GET /timing/today and GET /profile/system/{system_name}
+  wrap their compute call in ResponseCache.get_or_compute(...).
+- Golden fixtures store content_hash(payload) instead of full JSON.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, is_dataclass
+from json.encoder import encode_basestring
+from math import isfinite
+from operator import itemgetter
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from .instrumentation import count, span
+
+
+FLOAT_DECIMALS = 9
+HASH_ALGORITHM = "sha256"
+
+
+# ---------------------------------------------------------------------------
+# Canonical Serializer
+# ---------------------------------------------------------------------------
+
+def format_float(x: float, decimals: int = FLOAT_DECIMALS) -> str:
+    """Fixed-decimal float text: trailing zeros trimmed, integral values keep '.0'."""
+    if not isfinite(x):
+        raise ValueError(f"Canonical output cannot encode non-finite float {x!r}")
+    s = f"{x:.{decimals}f}".rstrip("0")
+    if s.endswith("."):
+        s += "0"
+    if s == "-0.0":
+        s = "0.0"
+    return s
+
+
+def _encode(obj: Any, parts: List[str], decimals: int) -> None:
+    t = type(obj)
+    if t is str:
+        parts.append(encode_basestring(obj))
+    elif t is float:
+        parts.append(format_float(obj, decimals))
+    elif obj is None:
+        parts.append("null")
+    elif obj is True:
+        parts.append("true")
+    elif obj is False:
+        parts.append("false")
+    elif t is int:
+        parts.append(str(obj))
+    elif isinstance(obj, dict):
+        items = sorted(((k if type(k) is str else _key(k), v) for k, v in obj.items()), key=itemgetter(0))
+        parts.append("{")
+        prev = None
+        for k, v in items:
+            if prev is not None:
+                if k == prev:
+                    raise ValueError(f"Canonical output keys collide after coercion to str: {k!r}")
+                parts.append(",")
+            prev = k
+            parts.append(encode_basestring(k))
+            parts.append(":")
+            _encode(v, parts, decimals)
+        parts.append("}")
+    elif isinstance(obj, (list, tuple)):
+        parts.append("[")
+        first = True
+        for v in obj:
+            if not first:
+                parts.append(",")
+            first = False
+            _encode(v, parts, decimals)
+        parts.append("]")
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        _encode(vars(obj), parts, decimals)
+    elif isinstance(obj, str):
+        parts.append(encode_basestring(str(obj)))
+    elif isinstance(obj, float):
+        parts.append(format_float(float(obj), decimals))
+    elif isinstance(obj, int):
+        parts.append(str(int(obj)))
+    else:
+        raise TypeError(f"Canonical output cannot encode {t.__name__}")
+
+
+def _key(k: Any) -> str:
+    # Mirrors json.dumps key coercion so int gate keys etc. stay compatible.
+    if isinstance(k, str):
+        return str(k)
+    if isinstance(k, bool) or k is None:
+        return "true" if k is True else "false" if k is False else "null"
+    if isinstance(k, float):
+        return format_float(k)
+    if isinstance(k, int):
+        return str(int(k))
+    raise TypeError(f"Canonical output keys must be str/int/float; got {type(k).__name__}")
+
+
+def canonical_dumps(obj: Any, *, float_decimals: int = FLOAT_DECIMALS) -> bytes:
+    """
+    Serialize obj to canonical UTF-8 JSON bytes.
+
+    Non-str keys are coerced like json.dumps coerces them; two keys that
+    coerce to the same text (e.g. {1: ..., "1": ...}) raise ValueError rather
+    than emitting a duplicate key. Every float goes through format_float in
+    Python, so this costs about twice json.dumps(sort_keys=True); hot request
+    paths should serve cached bytes via ResponseCache instead of re-serializing.
+    """
+    parts: List[str] = []
+    _encode(obj, parts, float_decimals)
+    return "".join(parts).encode("utf-8")
+
+
+def content_hash(obj: Any, *, float_decimals: int = FLOAT_DECIMALS) -> str:
+    """Hex digest of the canonical serialization (bytes are hashed as-is)."""
+    body = obj if isinstance(obj, (bytes, bytearray)) else canonical_dumps(obj, float_decimals=float_decimals)
+    return hashlib.new(HASH_ALGORITHM, body).hexdigest()
+
+
+@dataclass(frozen=True)
+class CanonicalPayload:
+    body: bytes
+    digest: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+def canonicalize(obj: Any, *, float_decimals: int = FLOAT_DECIMALS) -> CanonicalPayload:
+    body = canonical_dumps(obj, float_decimals=float_decimals)
+    return CanonicalPayload(body=body, digest=hashlib.new(HASH_ALGORITHM, body).hexdigest())
+
+
+# ---------------------------------------------------------------------------
+# Conditional Response Cache (ETag / 304)
+# ---------------------------------------------------------------------------
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for c in candidates:
+        if (c[2:] if c.startswith("W/") else c) == opaque:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int                      # 200 | 304
+    payload: CanonicalPayload
+
+    @property
+    def body(self) -> bytes:
+        return self.payload.body if self.status == 200 else b""
+
+    @property
+    def headers(self) -> Tuple[Tuple[str, str], ...]:
+        return (("ETag", self.payload.etag),)
+
+
+def timing_today_key(user_id: str, date_local: str, engine_version: str) -> Tuple[str, ...]:
+    return ("timing_today", str(user_id), date_local, engine_version)
+
+
+def system_profile_key(user_id: str, system_name: str, engine_version: str) -> Tuple[str, ...]:
+    return ("profile_system", str(user_id), system_name, engine_version)
+
+
+class ResponseCache:
+    """
+    LRU cache of canonical payloads keyed by request identity.
+
+    The key must capture every input of the computation (user, date, engine
+    version, ...), so a cached entry is valid until explicitly invalidated
+    (e.g. POST /profile/birth invalidates that user's entries).
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CanonicalPayload]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[CanonicalPayload]:
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        return payload
+
+    def put(self, key: Hashable, obj: Any) -> CanonicalPayload:
+        payload = obj if isinstance(obj, CanonicalPayload) else canonicalize(obj)
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return payload
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        *,
+        if_none_match: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Serve from cache when possible:
+        - cached + matching If-None-Match → 304, no serialization, no compute
+        - cached → 200 with the stored bytes
+        - otherwise compute, canonicalize, store, then answer as above
+        """
+        payload = self.get(key)
+        if payload is None:
+            self.misses += 1
+            count("response_cache.misses")
+            obj = compute()
+            with span("serialize"):
+                payload = self.put(key, obj)
+        else:
+            self.hits += 1
+            count("response_cache.hits")
+
+        status = 304 if etag_matches(if_none_match, payload.etag) else 200
+        return CachedResponse(status=status, payload=payload)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop every entry whose key tuple carries user_id in position 1."""
+        user_id = str(user_id)
+        stale = [k for k in self._entries if isinstance(k, tuple) and len(k) > 1 and k[1] == user_id]
+        for k in stale:
+            del self._entries[k]
+        return len(stale)
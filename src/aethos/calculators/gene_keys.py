@@ -11,14 +11,22 @@
 #   Therefore: do NOT compute gates from longitude using naive 360/64 bins.
 #
 # Data:
-#   Shadow/Gift/Siddhi strings for all 64 Gene Keys.
-#   (If you prefer, move this dict to JSON and load it.)
+#   Shadow/Gift/Siddhi strings for all 64 Gene Keys live in data/gene_keys.json
+#   and are loaded on first lookup, so importing this module stays cheap.
 # ──────────────────────────────────────────────────────────────────────────────
 
 from __future__ import annotations
 
+import os
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .instrumentation import timed
+
+# Stored alongside gene_keys payloads; bump when the table or mapping changes.
+ENGINE_VERSION = "0.1.0-scaffold"
 
 
 @dataclass(frozen=True)
@@ -29,83 +37,96 @@ class GeneKey:
     siddhi: str
 
 
-# Full 64 Gene Keys — Shadow / Gift / Siddhi
+# Full 64 Gene Keys — Shadow / Gift / Siddhi, stored in data/gene_keys.json.
 # Note: Some words intentionally repeat across bands for specific keys (e.g., 30 Desire→Desire→Rapture).
 # If you ever need to audit any entry, cross-check against the official genekeys.com Gene Key pages.
-GENE_KEYS: Dict[int, Dict[str, str]] = {
-    1:  {"shadow": "Entropy", "gift": "Freshness", "siddhi": "Beauty"},
-    2:  {"shadow": "Dislocation", "gift": "Orientation", "siddhi": "Unity"},
-    3:  {"shadow": "Chaos", "gift": "Innovation", "siddhi": "Innocence"},
-    4:  {"shadow": "Intolerance", "gift": "Understanding", "siddhi": "Forgiveness"},
-    5:  {"shadow": "Impatience", "gift": "Patience", "siddhi": "Timelessness"},
-    6:  {"shadow": "Conflict", "gift": "Diplomacy", "siddhi": "Peace"},
-    7:  {"shadow": "Division", "gift": "Guidance", "siddhi": "Virtue"},
-    8:  {"shadow": "Mediocrity", "gift": "Style", "siddhi": "Exquisiteness"},
-    9:  {"shadow": "Inertia", "gift": "Determination", "siddhi": "Invincibility"},
-    10: {"shadow": "Self-Obsession", "gift": "Naturalness", "siddhi": "Being"},
-    11: {"shadow": "Obscurity", "gift": "Idealism", "siddhi": "Light"},
-    12: {"shadow": "Vanity", "gift": "Discrimination", "siddhi": "Purity"},
-    13: {"shadow": "Discord", "gift": "Discernment", "siddhi": "Empathy"},
-    14: {"shadow": "Compromise", "gift": "Competence", "siddhi": "Bounteousness"},
-    15: {"shadow": "Dullness", "gift": "Magnetism", "siddhi": "Florescence"},
-    16: {"shadow": "Indifference", "gift": "Versatility", "siddhi": "Mastery"},
-    17: {"shadow": "Opinion", "gift": "Far-sightedness", "siddhi": "Omniscience"},
-    18: {"shadow": "Judgment", "gift": "Integrity", "siddhi": "Perfection"},
-    19: {"shadow": "Co-dependence", "gift": "Sensitivity", "siddhi": "Sacrifice"},
-    20: {"shadow": "Superficiality", "gift": "Self-Assurance", "siddhi": "Presence"},
-    21: {"shadow": "Control", "gift": "Authority", "siddhi": "Valor"},
-    22: {"shadow": "Dishonor", "gift": "Graciousness", "siddhi": "Grace"},
-    23: {"shadow": "Complexity", "gift": "Simplicity", "siddhi": "Quintessence"},
-    24: {"shadow": "Addiction", "gift": "Invention", "siddhi": "Silence"},
-    25: {"shadow": "Constriction", "gift": "Acceptance", "siddhi": "Universal Love"},
-    26: {"shadow": "Pride", "gift": "Artfulness", "siddhi": "Invisibility"},
-    27: {"shadow": "Selfishness", "gift": "Altruism", "siddhi": "Selflessness"},
-    28: {"shadow": "Purposelessness", "gift": "Totality", "siddhi": "Immortality"},
-    29: {"shadow": "Half-heartedness", "gift": "Commitment", "siddhi": "Devotion"},
-    30: {"shadow": "Desire", "gift": "Desire", "siddhi": "Rapture"},
-    31: {"shadow": "Arrogance", "gift": "Leadership", "siddhi": "Humility"},
-    32: {"shadow": "Failure", "gift": "Preservation", "siddhi": "Veneration"},
-    33: {"shadow": "Forgetting", "gift": "Mindfulness", "siddhi": "Revelation"},
-    34: {"shadow": "Force", "gift": "Strength", "siddhi": "Majesty"},
-    35: {"shadow": "Hunger", "gift": "Adventure", "siddhi": "Boundlessness"},
-    36: {"shadow": "Turbulence", "gift": "Humanity", "siddhi": "Compassion"},
-    37: {"shadow": "Weakness", "gift": "Equality", "siddhi": "Tenderness"},
-    38: {"shadow": "Struggle", "gift": "Perseverance", "siddhi": "Honor"},
-    39: {"shadow": "Provocation", "gift": "Dynamism", "siddhi": "Liberation"},
-    40: {"shadow": "Exhaustion", "gift": "Resolve", "siddhi": "Divine Will"},
-    41: {"shadow": "Fantasy", "gift": "Anticipation", "siddhi": "Emanation"},
-    42: {"shadow": "Expectation", "gift": "Detachment", "siddhi": "Celebration"},
-    43: {"shadow": "Deafness", "gift": "Insight", "siddhi": "Epiphany"},
-    44: {"shadow": "Interference", "gift": "Synergy", "siddhi": "Teamwork"},
-    45: {"shadow": "Dominance", "gift": "Synergy", "siddhi": "Communion"},
-    46: {"shadow": "Seriousness", "gift": "Delight", "siddhi": "Ecstasy"},
-    47: {"shadow": "Oppression", "gift": "Transmutation", "siddhi": "Transfiguration"},
-    48: {"shadow": "Inadequacy", "gift": "Resourcefulness", "siddhi": "Wisdom"},
-    49: {"shadow": "Reaction", "gift": "Revolution", "siddhi": "Rebirth"},
-    50: {"shadow": "Corruption", "gift": "Equilibrium", "siddhi": "Harmony"},
-    51: {"shadow": "Agitation", "gift": "Initiative", "siddhi": "Awakening"},
-    52: {"shadow": "Stress", "gift": "Restraint", "siddhi": "Stillness"},
-    53: {"shadow": "Immaturity", "gift": "Expansion", "siddhi": "Superabundance"},
-    54: {"shadow": "Greed", "gift": "Aspiration", "siddhi": "Ascension"},
-    55: {"shadow": "Victimization", "gift": "Freedom", "siddhi": "Freedom"},
-    56: {"shadow": "Distraction", "gift": "Enrichment", "siddhi": "Intoxication"},
-    57: {"shadow": "Unease", "gift": "Intuition", "siddhi": "Clarity"},
-    58: {"shadow": "Dissatisfaction", "gift": "Vitality", "siddhi": "Bliss"},
-    59: {"shadow": "Dishonesty", "gift": "Intimacy", "siddhi": "Transparency"},
-    60: {"shadow": "Limitation", "gift": "Realism", "siddhi": "Justice"},
-    61: {"shadow": "Psychosis", "gift": "Inspiration", "siddhi": "Sanctity"},
-    62: {"shadow": "Intellect", "gift": "Precision", "siddhi": "Impeccability"},
-    63: {"shadow": "Doubt", "gift": "Inquiry", "siddhi": "Truth"},
-    64: {"shadow": "Confusion", "gift": "Imagination", "siddhi": "Illumination"},
-}
+GENE_KEYS_PATH = os.path.join(os.path.dirname(__file__), "data", "gene_keys.json")
 
+# Gate validation must not force the text table to load.
+_VALID_GATES = frozenset(range(1, 65))
 
-def gate_to_gene_key(gate: int) -> GeneKey:
-    """Convert a gate number (1–64) into a GeneKey dataclass."""
-    if gate not in GENE_KEYS:
+
+class _Tables:
+    # Plain slotted class: a dataclass here would cost more at import than the table itself.
+    __slots__ = ("gene_keys", "records", "rows_int", "rows_str")
+
+    def __init__(
+        self,
+        gene_keys: Dict[int, Dict[str, str]],
+        records: Tuple[Optional[GeneKey], ...],
+        rows_int: Tuple[Optional[Dict[str, Any]], ...],
+        rows_str: Tuple[Optional[Dict[str, str]], ...],
+    ) -> None:
+        self.gene_keys = gene_keys
+        self.records = records
+        self.rows_int = rows_int
+        self.rows_str = rows_str
+
+
+_TABLES: Optional[_Tables] = None
+
+
+# Flyweight records: built once on first use, indexed by gate (slot 0 unused),
+# strings interned. Every lookup below returns these shared instances instead
+# of new objects; output rows are handed out as .copy() so callers may mutate.
+def _load_tables() -> _Tables:
+    global _TABLES
+    import json
+
+    with open(GENE_KEYS_PATH, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    gene_keys = {int(g): d for g, d in raw.items()}
+    if set(gene_keys) != _VALID_GATES:
+        raise RuntimeError(f"{GENE_KEYS_PATH} must define gates 1..64 exactly")
+
+    records: List[Optional[GeneKey]] = [None] * 65
+    for gate, d in gene_keys.items():
+        records[gate] = GeneKey(
+            gate=gate,
+            shadow=sys.intern(d["shadow"]),
+            gift=sys.intern(d["gift"]),
+            siddhi=sys.intern(d["siddhi"]),
+        )
+    gate_str = tuple(sys.intern(str(g)) for g in range(65))
+
+    _TABLES = _Tables(
+        gene_keys=gene_keys,
+        records=tuple(records),
+        rows_int=tuple(
+            None if r is None else {"gate": r.gate, "shadow": r.shadow, "gift": r.gift, "siddhi": r.siddhi}
+            for r in records
+        ),
+        rows_str=tuple(
+            None if r is None else {"gate": gate_str[r.gate], "shadow": r.shadow, "gift": r.gift, "siddhi": r.siddhi}
+            for r in records
+        ),
+    )
+    return _TABLES
+
+
+def _tables() -> _Tables:
+    return _TABLES or _load_tables()
+
+
+def __getattr__(name: str) -> Any:
+    # GENE_KEYS / GENE_KEY_RECORDS stay importable names, but only load on access.
+    if name == "GENE_KEYS":
+        return _tables().gene_keys
+    if name == "GENE_KEY_RECORDS":
+        return _tables().records
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _check_gate(gate: Any) -> int:
+    if gate not in _VALID_GATES:
         raise ValueError(f"Gate must be 1..64; got {gate}")
-    d = GENE_KEYS[gate]
-    return GeneKey(gate=gate, shadow=d["shadow"], gift=d["gift"], siddhi=d["siddhi"])
+    return int(gate)
+
+
+def gate_to_gene_key(gate: int) -> GeneKey:
+    """Convert a gate number (1–64) into its (shared) GeneKey record."""
+    return _tables().records[_check_gate(gate)]  # type: ignore[return-value]
 
 
 def lon_to_gene_key(lon: float, lon_to_gate: Callable[[float], int]) -> GeneKey:
@@ -124,6 +145,7 @@ def lon_to_gene_key(lon: float, lon_to_gate: Callable[[float], int]) -> GeneKey:
     return gate_to_gene_key(gate)
 
 
+@timed("gene_keys")
 def add_gene_keys_to_points_inplace(
     points: Dict[str, Dict[str, Any]],
     *,
@@ -142,6 +164,7 @@ def add_gene_keys_to_points_inplace(
       chart["western_tropical"]["points"]
       chart["human_design"]["personality"]["activations"] (if you store gates there)
     """
+    rows = _tables().rows_int
     for name, data in points.items():
         gate: Optional[int] = None
 
@@ -153,10 +176,10 @@ def add_gene_keys_to_points_inplace(
         if gate is None:
             continue
 
-        gk = gate_to_gene_key(gate)
-        data[out_field] = {"gate": gk.gate, "shadow": gk.shadow, "gift": gk.gift, "siddhi": gk.siddhi}
+        data[out_field] = rows[_check_gate(gate)].copy()
 
 
+@timed("gene_keys")
 def compute_gene_keys_layer(
     points: Mapping[str, Mapping[str, Any]],
     *,
@@ -172,6 +195,7 @@ def compute_gene_keys_layer(
       - points with `lon` plus an injected lon_to_gate mapper.
     """
     out: Dict[str, Dict[str, str]] = {}
+    rows = _tables().rows_str
 
     for name, data in points.items():
         gate: Optional[int] = None
@@ -184,12 +208,209 @@ def compute_gene_keys_layer(
         if gate is None:
             continue
 
-        gk = gate_to_gene_key(gate)
-        out[name] = {"gate": str(gk.gate), "shadow": gk.shadow, "gift": gk.gift, "siddhi": gk.siddhi}
+        out[name] = rows[_check_gate(gate)].copy()
+
+    return out
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Columnar batch layer
+# ──────────────────────────────────────────────────────────────────────────────
+#
+# Many profiles are held as compact index arrays (point code + gate [+ line])
+# and only expanded to Shadow/Gift/Siddhi text when serialized.
+
+
+@dataclass(frozen=True)
+class GeneKeysBatch:
+    point_names: Tuple[str, ...]   # point code -> interned point name
+    offsets: array                 # 'L': profile i owns rows offsets[i]:offsets[i+1]
+    point_codes: array             # 'B': index into point_names
+    gates: array                   # 'B': 1..64
+    lines: array                   # 'B': 1..6, 0 = unknown
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _rows(self, i: int) -> range:
+        return range(self.offsets[i], self.offsets[i + 1])
+
+    def profile_gates(self, i: int) -> Dict[str, int]:
+        names, codes, gates = self.point_names, self.point_codes, self.gates
+        return {names[codes[r]]: gates[r] for r in self._rows(i)}
+
+    def expand(self, i: int) -> Dict[str, Dict[str, str]]:
+        """Profile i in the compute_gene_keys_layer output shape."""
+        names, codes, gates = self.point_names, self.point_codes, self.gates
+        rows = _tables().rows_str
+        return {names[codes[r]]: rows[gates[r]].copy() for r in self._rows(i)}
+
+    def expand_all(self) -> List[Dict[str, Dict[str, str]]]:
+        return [self.expand(i) for i in range(len(self))]
+
 
+class _BatchBuilder:
+    def __init__(self, point_names: Sequence[str] = ()) -> None:
+        self.point_names: List[str] = [sys.intern(n) for n in point_names]
+        self._codes: Dict[str, int] = {n: i for i, n in enumerate(self.point_names)}
+        self.offsets = array("L", [0])
+        self.point_codes = array("B")
+        self.gates = array("B")
+        self.lines = array("B")
+
+    def code(self, name: str) -> int:
+        c = self._codes.get(name)
+        if c is None:
+            if len(self.point_names) >= 255:
+                raise ValueError("GeneKeysBatch supports at most 255 distinct point names")
+            c = self._codes[name] = len(self.point_names)
+            self.point_names.append(sys.intern(name))
+        return c
+
+    def add(self, code: int, gate: int, line: int = 0) -> None:
+        self.point_codes.append(code)
+        self.gates.append(_check_gate(gate))
+        self.lines.append(line if isinstance(line, int) and 1 <= line <= 6 else 0)
+
+    def end_profile(self) -> None:
+        self.offsets.append(len(self.gates))
+
+    def build(self) -> GeneKeysBatch:
+        return GeneKeysBatch(
+            point_names=tuple(self.point_names),
+            offsets=self.offsets,
+            point_codes=self.point_codes,
+            gates=self.gates,
+            lines=self.lines,
+        )
+
+
+@timed("gene_keys")
+def compute_gene_keys_batch(
+    profiles: Iterable[Mapping[str, Mapping[str, Any]]],
+    *,
+    lon_to_gate: Optional[Callable[[float], int]] = None,
+    gate_field: str = "gate",
+    lon_field: str = "lon",
+    line_field: str = "line",
+) -> GeneKeysBatch:
+    """
+    Batch form of compute_gene_keys_layer: one entry per points mapping, same
+    gate/lon precedence, but stored as index arrays instead of text dicts.
+    """
+    b = _BatchBuilder()
+    for points in profiles:
+        for name, data in points.items():
+            gate: Optional[int] = None
+            if gate_field in data and isinstance(data[gate_field], int):
+                gate = int(data[gate_field])
+            elif lon_to_gate is not None and lon_field in data and isinstance(data[lon_field], (int, float)):
+                gate = lon_to_gate(float(data[lon_field]))
+            if gate is None:
+                continue
+            b.add(b.code(name), gate, data.get(line_field, 0))
+        b.end_profile()
+    return b.build()
+
+
+@timed("gene_keys")
+def gene_keys_batch_from_columns(
+    point_names: Sequence[str],
+    rows: Iterable[Sequence[float]],
+    *,
+    lon_to_gate: Optional[Callable[[float], int]] = None,
+) -> GeneKeysBatch:
+    """
+    Build a batch from aligned columns: each row holds one value per point
+    name, either gates (lon_to_gate=None) or longitudes mapped through the
+    injected mandala-aware lon_to_gate. None entries are skipped.
+    """
+    b = _BatchBuilder(point_names)
+    n = len(b.point_names)
+    for row in rows:
+        if len(row) != n:
+            raise ValueError(f"Row has {len(row)} values; expected {n}")
+        for code, v in enumerate(row):
+            if v is None:
+                continue
+            b.add(code, lon_to_gate(float(v)) if lon_to_gate is not None else v)
+        b.end_profile()
+    return b.build()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Hologenetic Profile (Activation / Venus / Pearl sequences)
+# ──────────────────────────────────────────────────────────────────────────────
+
+# sequence -> ((sphere, side, point), ...); side is "personality" or "design".
+HOLOGENETIC_SEQUENCES: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    "activation": (
+        ("lifes_work", "personality", "Sun"),
+        ("evolution", "personality", "Earth"),
+        ("radiance", "design", "Sun"),
+        ("purpose", "design", "Earth"),
+    ),
+    "venus": (
+        ("attraction", "design", "Moon"),
+        ("iq", "personality", "Venus"),
+        ("eq", "personality", "Mars"),
+        ("sq", "design", "Venus"),
+        ("core", "design", "Mars"),
+    ),
+    "pearl": (
+        ("vocation", "design", "Mars"),
+        ("culture", "design", "Jupiter"),
+        ("pearl", "personality", "Jupiter"),
+        ("brand", "personality", "Sun"),
+    ),
+}
+
+
+def hologenetic_profile_from_batch(
+    batch: GeneKeysBatch,
+    personality_index: int,
+    design_index: int,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Assemble the three sequences from two batch entries (personality, design).
+    Spheres whose source point is missing are omitted.
+    """
+    rows: Dict[str, Dict[str, int]] = {"personality": {}, "design": {}}
+    for side, i in (("personality", personality_index), ("design", design_index)):
+        side_rows = rows[side]
+        for r in batch._rows(i):
+            side_rows[batch.point_names[batch.point_codes[r]]] = r
+
+    text_rows = _tables().rows_str
+    out: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for seq, spheres in HOLOGENETIC_SEQUENCES.items():
+        seq_out: Dict[str, Dict[str, Any]] = {}
+        for sphere, side, point in spheres:
+            r = rows[side].get(point)
+            if r is None:
+                continue
+            row: Dict[str, Any] = text_rows[batch.gates[r]].copy()
+            if batch.lines[r]:
+                row["line"] = batch.lines[r]
+            seq_out[sphere] = row
+        out[seq] = seq_out
     return out
 
 
+def compute_hologenetic_profile(
+    personality: Mapping[str, Mapping[str, Any]],
+    design: Mapping[str, Mapping[str, Any]],
+    *,
+    lon_to_gate: Optional[Callable[[float], int]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Activation / Venus / Pearl sequences from HD activations, e.g.
+      compute_hologenetic_profile(hd["personality"]["activations"], hd["design"]["activations"])
+    """
+    batch = compute_gene_keys_batch((personality, design), lon_to_gate=lon_to_gate)
+    return hologenetic_profile_from_batch(batch, 0, 1)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Integration snippets (copy into profile_builder.py)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -206,7 +427,19 @@ def compute_gene_keys_layer(
 #   from aethos.calculators.human_design import lon_to_gate as hd_lon_to_gate
 #   profile["gene_keys"] = compute_gene_keys_layer(chart["western_tropical"]["points"], lon_to_gate=hd_lon_to_gate)
 #
-# 3) Summary spine:
+# 3) Many profiles at once (index arrays; text only at serialization):
+#
+#   batch = compute_gene_keys_batch(p["human_design"]["personality"]["activations"] for p in profiles)
+#   payloads = batch.expand_all()
+#
+# 4) Hologenetic profile:
+#
+#   profile["gene_keys"]["hologenetic"] = compute_hologenetic_profile(
+#       profile["human_design"]["personality"]["activations"],
+#       profile["human_design"]["design"]["activations"],
+#   )
+#
+# 5) Summary spine:
 #
 #   sun = profile["gene_keys"]["personality"]["Sun"]
 #   profile["summary"]["gene_keys_sun"] = f"{sun['shadow']} → {sun['gift']} → {sun['siddhi']}"
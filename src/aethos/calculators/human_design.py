@@ -19,8 +19,14 @@ Integration:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Tuple, Callable
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Callable
+
+from .instrumentation import count, enabled, span
+
+ENGINE_VERSION = "0.1.0-scaffold"
 
 
 @dataclass(frozen=True)
@@ -44,13 +50,45 @@ def normalize_deg(lon: float) -> float:
 #   GATE_START_DEG[gate] = start_degree (0..360)
 # and we find the gate such that start <= lon < next_start (circularly).
 #
-GATE_START_DEG: Dict[int, float] = {
+# Install the table with set_gate_wheel(mapping); it rebuilds lon_to_gate's
+# sorted index. GATE_START_DEG is read-only afterwards, so the index cannot
+# silently go stale: in-place writes raise, and a module attribute rebound to
+# a new mapping is re-validated and re-indexed on the next lookup.
+#
+GATE_START_DEG: Mapping[int, float] = MappingProxyType({
     # Placeholder — NOT CORRECT.
     # Example only:
     # 41: 300.0,
     # 19: 305.625,
     # ...
-}
+})
+
+# (table the index was built from, sorted starts, gates in the same order)
+_GATE_INDEX: Optional[Tuple[Mapping[int, float], List[float], List[int]]] = None
+
+
+def set_gate_wheel(mapping: Mapping[int, float]) -> None:
+    """Install the gate wheel (gate -> start degree) and rebuild the lookup index."""
+    global GATE_START_DEG, _GATE_INDEX
+    table = {int(g): normalize_deg(float(start)) for g, start in mapping.items()}
+    if set(table) != set(range(1, 65)):
+        raise ValueError("gate wheel must map every gate 1..64 to a start degree")
+    items = sorted(table.items(), key=lambda x: x[1])  # (gate, start)
+    GATE_START_DEG = MappingProxyType(table)
+    _GATE_INDEX = (GATE_START_DEG, [start for _, start in items], [g for g, _ in items])
+
+
+def _gate_index() -> Tuple[List[float], List[int]]:
+    index = _GATE_INDEX
+    if index is None or index[0] is not GATE_START_DEG:
+        if len(GATE_START_DEG) < 64:
+            raise RuntimeError(
+                "Human Design gate wheel mapping table is not initialized. "
+                "Install the mandala mapping with set_gate_wheel(...)."
+            )
+        set_gate_wheel(GATE_START_DEG)
+        index = _GATE_INDEX
+    return index[1], index[2]
 
 
 def lon_to_gate(lon: float) -> int:
@@ -61,28 +99,10 @@ def lon_to_gate(lon: float) -> int:
     - This function will raise until GATE_START_DEG is populated with the real mapping.
     - That is intentional: we prefer failing loudly to returning wrong gates.
     """
-    if not GATE_START_DEG or len(GATE_START_DEG) < 64:
-        raise RuntimeError(
-            "Human Design gate wheel mapping table is not initialized. "
-            "Populate GATE_START_DEG with correct mandala mapping."
-        )
-
-    lon_n = normalize_deg(lon)
-
-    # Sort gates by start degrees
-    items = sorted(GATE_START_DEG.items(), key=lambda x: x[1])  # (gate, start)
-    starts = [s for _, s in items]
-    gates = [g for g, _ in items]
-
-    # Find rightmost start <= lon_n
-    idx = 0
-    for i, s in enumerate(starts):
-        if lon_n >= s:
-            idx = i
-        else:
-            break
+    starts, gates = _gate_index()
 
-    return gates[idx]
+    # Rightmost start <= lon; below the first start wraps to the last gate.
+    return gates[bisect_right(starts, normalize_deg(lon)) - 1]
 
 
 def lon_to_gate_line(lon: float, gate_start_deg: float) -> Activation:
@@ -134,6 +154,29 @@ def solve_design_jd(
     Returns:
     - design_jd_ut
     """
+    if not enabled():
+        return _solve_design_jd(birth_jd_ut, sun_lon_at, target_arc_deg, tol_deg, max_days_back)
+
+    with span("design_jd_solve"):
+        evals = [0]
+
+        def sun_at(jd: float) -> float:
+            evals[0] += 1
+            return sun_lon_at(jd)
+
+        try:
+            return _solve_design_jd(birth_jd_ut, sun_at, target_arc_deg, tol_deg, max_days_back)
+        finally:
+            count("ephemeris.evaluations", evals[0])
+
+
+def _solve_design_jd(
+    birth_jd_ut: float,
+    sun_lon_at: Callable[[float], float],
+    target_arc_deg: float,
+    tol_deg: float,
+    max_days_back: float,
+) -> float:
     sun_birth = normalize_deg(sun_lon_at(birth_jd_ut))
 
     # Bracket search backwards in time
@@ -154,21 +197,24 @@ def solve_design_jd(
         days += step
     else:
         raise RuntimeError("Could not bracket design date within max_days_back window.")
+    count("design_jd.bracket_steps", int(days / step) + 1)
 
     # Binary search between jd_lo (arc >= target) and jd_hi (arc < target)
     lo = jd_lo
     hi = jd_hi
 
-    for _ in range(60):
+    for i in range(60):
         mid = (lo + hi) / 2.0
         a = arc(mid)
         if abs(a - target_arc_deg) <= tol_deg:
+            count("design_jd.bisect_iterations", i + 1)
             return mid
         if a >= target_arc_deg:
             lo = mid
         else:
             hi = mid
 
+    count("design_jd.bisect_iterations", 60)
     return (lo + hi) / 2.0
 
 
@@ -209,12 +255,13 @@ def compute_human_design_layer(
         positions_design = compute_positions_at_jd(design_jd_ut)
 
     # Build activations for personality and design
-    personality = _build_activations(positions_birth)
-    design = _build_activations(positions_design)
+    with span("activations"):
+        personality = _build_activations(positions_birth)
+        design = _build_activations(positions_design)
 
     # Type/profile/authority are intentionally NOT computed in V1 scaffold
     return {
-        "engine_version": "0.1.0-scaffold",
+        "engine_version": ENGINE_VERSION,
         "birth_jd_ut": birth_jd_ut,
         "design_jd_ut": design_jd_ut,
         "personality": {"activations": personality},
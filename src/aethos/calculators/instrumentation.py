@@ -0,0 +1,290 @@
+"""
+instrumentation.py — Aethos V1 (Scaffold)
+
+Purpose:
+- Opt-in visibility into where time goes inside a profile build or a daily bundle:
+  - spans: wall time per stage (canonicalize, western_points, design_jd_solve,
+    activations, gene_keys, sidereal, aspects, crossings, ...)
+  - counters: ephemeris evaluations, solver iterations, cache hits/misses
+- Pluggable sinks: in-memory, logging, Prometheus text file.
+
+Cost when disabled:
+- span()/count() read one ContextVar and return; span() hands back a shared
+  no-op context manager. No allocation, no clock reads. @timed(stage) does the
+  same read and calls straight through.
+- Sink dependencies (logging, json, tempfile) are imported when a sink is
+  used, not when a calculator module imports span/count.
+
+Usage:
+    with instrumented(sink=LogSink()) as rec:
+        bundle = build_daily_timing_events(...)
+    rec.snapshot()  # {"spans": {...}, "counters": {...}}
+
+Nested instrumented() blocks fold their totals into the enclosing recorder on exit.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    import logging
+
+_perf = time.perf_counter
+_COMPILED_IN = os.environ.get("AETHOS_INSTRUMENTATION", "1") != "0"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total_s += elapsed
+        if elapsed > self.max_s:
+            self.max_s = elapsed
+
+    def merge(self, other: "SpanStats") -> None:
+        self.count += other.count
+        self.total_s += other.total_s
+        self.max_s = max(self.max_s, other.max_s)
+
+
+@dataclass
+class Recorder:
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def add_span(self, name: str, elapsed: float) -> None:
+        stats = self.spans.get(name)
+        if stats is None:
+            stats = self.spans[name] = SpanStats()
+        stats.add(elapsed)
+
+    def incr(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, other: "Recorder") -> None:
+        for name, stats in other.spans.items():
+            self.spans.setdefault(name, SpanStats()).merge(stats)
+        for name, n in other.counters.items():
+            self.incr(name, n)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregates in payload-meta form (milliseconds, sorted keys)."""
+        return {
+            "spans": {
+                name: {
+                    "count": s.count,
+                    "total_ms": round(s.total_s * 1000.0, 3),
+                    "max_ms": round(s.max_s * 1000.0, 3),
+                }
+                for name, s in sorted(self.spans.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+
+_ACTIVE: ContextVar[Optional[Recorder]] = ContextVar("aethos_instrumentation", default=None)
+
+
+# ---------------------------------------------------------------------------
+# Hot-path API
+# ---------------------------------------------------------------------------
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_rec", "_name", "_t0")
+
+    def __init__(self, rec: Recorder, name: str) -> None:
+        self._rec = rec
+        self._name = name
+
+    def __enter__(self) -> "_Span":
+        self._t0 = _perf()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._rec.add_span(self._name, _perf() - self._t0)
+
+
+def span(name: str) -> Any:
+    """Context manager timing one stage; a shared no-op when disabled."""
+    rec = _ACTIVE.get()
+    if rec is None:
+        return _NOOP_SPAN
+    return _Span(rec, name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator form of span(name) for stages that are a whole function, so the
+    body is not re-indented under a with block. AETHOS_INSTRUMENTATION=0 in the
+    environment at import time returns the function itself (no wrapper at all).
+    """
+    def decorate(fn: F) -> F:
+        if not _COMPILED_IN:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            rec = _ACTIVE.get()
+            if rec is None:
+                return fn(*args, **kwargs)
+            t0 = _perf()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                rec.add_span(name, _perf() - t0)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def count(name: str, n: int = 1) -> None:
+    rec = _ACTIVE.get()
+    if rec is not None:
+        rec.incr(name, n)
+
+
+def enabled() -> bool:
+    return _ACTIVE.get() is not None
+
+
+def current() -> Optional[Recorder]:
+    return _ACTIVE.get()
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+class Sink(Protocol):
+    def emit(self, snapshot: Dict[str, Any]) -> None: ...
+
+
+class MemorySink:
+    def __init__(self) -> None:
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        self.snapshots.append(snapshot)
+
+
+class LogSink:
+    def __init__(self, logger: Optional["logging.Logger"] = None, level: int = 20) -> None:  # logging.INFO
+        import logging
+
+        self.logger = logger or logging.getLogger("aethos.calculators.instrumentation")
+        self.level = level
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        import json
+
+        self.logger.log(self.level, "calc_instrumentation %s", json.dumps(snapshot, sort_keys=True))
+
+
+class PrometheusTextFileSink:
+    """
+    Cumulative totals in Prometheus text exposition format, rewritten
+    atomically on every emit (node_exporter textfile collector layout).
+    """
+
+    def __init__(self, path: str, prefix: str = "aethos_calc") -> None:
+        self.path = path
+        self.prefix = prefix
+        self._totals = Recorder()
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        for name, s in snapshot["spans"].items():
+            stats = self._totals.spans.setdefault(name, SpanStats())
+            stats.count += s["count"]
+            stats.total_s += s["total_ms"] / 1000.0
+            stats.max_s = max(stats.max_s, s["max_ms"] / 1000.0)
+        for name, n in snapshot["counters"].items():
+            self._totals.incr(name, n)
+        self._write()
+
+    def render(self) -> str:
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_stage_seconds_total Wall time spent per calculator stage.",
+            f"# TYPE {p}_stage_seconds_total counter",
+        ]
+        for name, s in sorted(self._totals.spans.items()):
+            lines.append(f'{p}_stage_seconds_total{{stage="{name}"}} {s.total_s:.9f}')
+        lines += [
+            f"# HELP {p}_stage_calls_total Calls per calculator stage.",
+            f"# TYPE {p}_stage_calls_total counter",
+        ]
+        for name, s in sorted(self._totals.spans.items()):
+            lines.append(f'{p}_stage_calls_total{{stage="{name}"}} {s.count}')
+        lines += [
+            f"# HELP {p}_events_total Calculator counters (ephemeris evaluations, solver iterations, cache hits/misses).",
+            f"# TYPE {p}_events_total counter",
+        ]
+        for name, n in sorted(self._totals.counters.items()):
+            lines.append(f'{p}_events_total{{name="{name}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def _write(self) -> None:
+        import tempfile
+
+        text = self.render()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".prom-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            # mkstemp creates 0600; the textfile collector may run as another user.
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Activation
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def instrumented(sink: Optional[Sink] = None) -> Iterator[Recorder]:
+    """Enable instrumentation for the enclosed block (current context only)."""
+    rec = Recorder()
+    parent = _ACTIVE.get()
+    token = _ACTIVE.set(rec)
+    try:
+        yield rec
+    finally:
+        _ACTIVE.reset(token)
+        if parent is not None:
+            parent.merge(rec)
+        if sink is not None:
+            sink.emit(rec.snapshot())
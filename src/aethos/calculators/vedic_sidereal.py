@@ -0,0 +1,300 @@
+"""
+vedic_sidereal.py — Aethos V1 (Scaffold)
+
+Purpose:
+- Derive the Vedic sidereal layer from ALREADY-COMPUTED tropical positions:
+    sidereal_lon = tropical_lon - ayanamsa(jd)
+  so the Vedic system costs no extra ephemeris calls per point.
+- Nakshatra + pada for every point via a precomputed 27×4 boundary index.
+
+Ayanamsa:
+- V1 setting: Lahiri.
+- AyanamsaSeries tabulates the MEAN ayanamsa on a fixed JD grid (default every
+  10 days) and interpolates linearly; grid nodes are computed once per process.
+  The mean ayanamsa is smooth (~50"/year), so interpolation error is far below 1e-6°.
+- Tropical points are apparent positions (true equinox of date, the Swiss
+  Ephemeris default), so each evaluation adds nutation in longitude Δψ (up to
+  ~17") to the interpolated mean value. Δψ has a 13.7-day term and is not
+  tabulated. equinox="mean" skips it for mean-equinox tropical input.
+- Source: Swiss Ephemeris (swe.get_ayanamsa_ut, SIDM_LAHIRI, which is the mean
+  ayanamsa; Δψ from swe.calc_ut(ECL_NUT)) when installed, otherwise an
+  IAU-2006-style precession polynomial anchored at the Lahiri J2000 value and
+  the IAU 1980 main nutation terms (within 0.5"). Sources and equinox are
+  recorded in settings so payloads stay auditable.
+
+Integration:
+- canonical_chart.py provides chart["western_tropical"] (points + angles).
+- profile_builder.py calls compute_vedic_sidereal_layer(chart["western_tropical"], jd_ut=...).
+- Transit frames: pass frame.tropical / frame.angles the same way instead of
+  asking the ephemeris for sidereal positions (include_sidereal=False).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from math import floor, radians, sin
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .instrumentation import count, span
+
+ENGINE_VERSION = "0.1.1-scaffold"
+
+J2000_JD = 2451545.0
+LAHIRI_J2000_DEG = 23.857092          # Lahiri ayanamsa at J2000.0
+_PRECESSION_ARCSEC = (5028.796195, 1.1054348)   # per Julian century, T and T²
+
+
+def normalize_deg(lon: float) -> float:
+    lon = lon % 360.0
+    # x % 360.0 returns 360.0 for tiny negative x; keep the result in [0, 360).
+    return 0.0 if lon >= 360.0 else lon
+
+
+# ---------------------------------------------------------------------------
+# Ayanamsa
+# ---------------------------------------------------------------------------
+
+def lahiri_ayanamsa_polynomial(jd_ut: float) -> float:
+    """Mean Lahiri ayanamsa from general precession in longitude (no ephemeris needed)."""
+    t = (jd_ut - J2000_JD) / 36525.0
+    a1, a2 = _PRECESSION_ARCSEC
+    return LAHIRI_J2000_DEG + (a1 * t + a2 * t * t) / 3600.0
+
+
+# Meeus ch. 22 arguments in radians per Julian century: node Ω, 2L (Sun), 2L' (Moon).
+_NUT_OMEGA = (radians(125.04452), radians(-1934.136261))
+_NUT_2SUN = (radians(2 * 280.4665), radians(2 * 36000.7698))
+_NUT_2MOON = (radians(2 * 218.3165), radians(2 * 481267.8813))
+
+
+def nutation_longitude_deg(jd_ut: float) -> float:
+    """Nutation in longitude Δψ in degrees: IAU 1980 main terms (Meeus ch. 22, within 0.5")."""
+    t = (jd_ut - J2000_JD) / 36525.0
+    omega = _NUT_OMEGA[0] + _NUT_OMEGA[1] * t
+    return (
+        -17.20 * sin(omega)
+        - 1.32 * sin(_NUT_2SUN[0] + _NUT_2SUN[1] * t)
+        - 0.23 * sin(_NUT_2MOON[0] + _NUT_2MOON[1] * t)
+        + 0.21 * sin(2 * omega)
+    ) / 3600.0
+
+
+def _swisseph_lahiri() -> Optional[Callable[[float], float]]:
+    try:
+        import swisseph as swe  # type: ignore
+    except ImportError:
+        return None
+
+    def ayanamsa(jd_ut: float) -> float:
+        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+        return float(swe.get_ayanamsa_ut(jd_ut))
+
+    return ayanamsa
+
+
+def _swisseph_nutation() -> Optional[Callable[[float], float]]:
+    try:
+        import swisseph as swe  # type: ignore
+    except ImportError:
+        return None
+
+    def nutation(jd_ut: float) -> float:
+        # ECL_NUT row: true obliquity, mean obliquity, nutation in longitude, in obliquity.
+        return float(swe.calc_ut(jd_ut, swe.ECL_NUT)[0][2])
+
+    return nutation
+
+
+class AyanamsaSeries:
+    """
+    Tabulated ayanamsa with linear interpolation between grid nodes.
+
+    Nodes are filled lazily and kept for the life of the series, so a batch
+    of charts (or a long transit range) reuses the same few source calls.
+    `source` gives the mean ayanamsa; with equinox="true" (default) Δψ from
+    `nutation` is added per evaluation to match apparent tropical positions.
+    """
+
+    def __init__(
+        self,
+        source: Optional[Callable[[float], float]] = None,
+        *,
+        mode: str = "lahiri",
+        source_name: Optional[str] = None,
+        step_days: float = 10.0,
+        equinox: str = "true",
+        nutation: Optional[Callable[[float], float]] = None,
+    ) -> None:
+        if mode != "lahiri" and source is None:
+            raise ValueError(f"No built-in ayanamsa source for mode {mode!r}; pass source=...")
+        if equinox not in ("true", "mean"):
+            raise ValueError(f"equinox must be 'true' or 'mean', got {equinox!r}")
+        if source is None:
+            source = _swisseph_lahiri()
+            source_name = source_name or ("swisseph" if source else "precession_polynomial")
+            source = source or lahiri_ayanamsa_polynomial
+        self.mode = mode
+        self.source = source
+        self.source_name = source_name or getattr(source, "__name__", "custom")
+        self.step_days = float(step_days)
+        self.equinox = equinox
+        self.nutation_name: Optional[str] = None
+        if equinox == "true":
+            if nutation is None:
+                nutation = _swisseph_nutation()
+                self.nutation_name = "swisseph" if nutation else "iau1980_main_terms"
+                nutation = nutation or nutation_longitude_deg
+            self.nutation_name = self.nutation_name or getattr(nutation, "__name__", "custom")
+        elif nutation is not None:
+            raise ValueError("nutation is only used with equinox='true'")
+        self.nutation = nutation
+        self._nodes: Dict[int, float] = {}
+
+    def _node(self, k: int) -> float:
+        v = self._nodes.get(k)
+        if v is None:
+            count("ayanamsa.cache_misses")
+            v = self._nodes[k] = float(self.source(J2000_JD + k * self.step_days))
+        return v
+
+    def __call__(self, jd_ut: float) -> float:
+        x = (jd_ut - J2000_JD) / self.step_days
+        k = floor(x)
+        a = self._node(k)
+        mean = a + (self._node(k + 1) - a) * (x - k)
+        return mean if self.nutation is None else mean + self.nutation(jd_ut)
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "ayanamsa": self.mode,
+            "ayanamsa_source": self.source_name,
+            "ayanamsa_step_days": self.step_days,
+            "ayanamsa_equinox": self.equinox,
+            "ayanamsa_nutation": self.nutation_name,
+        }
+
+
+_DEFAULT_SERIES: Optional[AyanamsaSeries] = None
+
+
+def default_ayanamsa_series() -> AyanamsaSeries:
+    """Process-wide Lahiri series (built on first use)."""
+    global _DEFAULT_SERIES
+    if _DEFAULT_SERIES is None:
+        _DEFAULT_SERIES = AyanamsaSeries()
+    return _DEFAULT_SERIES
+
+
+# ---------------------------------------------------------------------------
+# Nakshatra / Pada Index
+# ---------------------------------------------------------------------------
+
+NAKSHATRAS: Tuple[str, ...] = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati",
+)
+
+NAKSHATRA_SPAN = 40.0 / 3.0   # 13°20'
+PADA_SPAN = 10.0 / 3.0        # 3°20'
+
+# 108 pada start degrees and the (nakshatra number 1..27, name, pada 1..4) they open.
+PADA_BOUNDARIES: Tuple[float, ...] = tuple(i * 10.0 / 3.0 for i in range(108))
+_PADA_INFO: Tuple[Tuple[int, str, int], ...] = tuple(
+    (i // 4 + 1, NAKSHATRAS[i // 4], i % 4 + 1) for i in range(108)
+)
+
+
+def nakshatra_pada(sidereal_lon: float) -> Tuple[int, str, int]:
+    """sidereal longitude -> (nakshatra number 1..27, nakshatra name, pada 1..4)."""
+    return _PADA_INFO[bisect_right(PADA_BOUNDARIES, normalize_deg(sidereal_lon)) - 1]
+
+
+def nakshatra_pada_batch(sidereal_lons: Iterable[float]) -> List[Tuple[int, str, int]]:
+    bounds, info = PADA_BOUNDARIES, _PADA_INFO
+    return [info[bisect_right(bounds, normalize_deg(lon)) - 1] for lon in sidereal_lons]
+
+
+# ---------------------------------------------------------------------------
+# Layer Builders
+# ---------------------------------------------------------------------------
+
+def to_sidereal(tropical_lon: float, jd_ut: float, ayanamsa: Optional[AyanamsaSeries] = None) -> float:
+    series = ayanamsa or default_ayanamsa_series()
+    return normalize_deg(tropical_lon - series(jd_ut))
+
+
+def _sidereal_block(
+    block: Mapping[str, Mapping[str, Any]],
+    ayan: float,
+    with_nakshatra: bool,
+) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, data in block.items():
+        lon = data.get("lon")
+        if not isinstance(lon, (int, float)):
+            out[name] = {"lon": None}
+            continue
+        sid = normalize_deg(float(lon) - ayan)
+        row: Dict[str, Any] = {"lon": sid}
+        if with_nakshatra:
+            number, nak, pada = _PADA_INFO[bisect_right(PADA_BOUNDARIES, sid) - 1]
+            row["nakshatra"] = nak
+            row["nakshatra_number"] = number
+            row["pada"] = pada
+        out[name] = row
+    return out
+
+
+def compute_vedic_sidereal_layer(
+    western_tropical: Mapping[str, Any],
+    *,
+    jd_ut: float,
+    ayanamsa: Optional[AyanamsaSeries] = None,
+) -> Dict[str, Any]:
+    """
+    Build profile["vedic_sidereal"] from chart["western_tropical"].
+
+    Points without a numeric lon (scaffold placeholders) stay {"lon": None}.
+    """
+    series = ayanamsa or default_ayanamsa_series()
+    with span("sidereal"):
+        ayan = series(jd_ut)
+        tropical_settings = western_tropical.get("settings", {})
+        return {
+            "engine_version": ENGINE_VERSION,
+            "settings": {
+                "zodiac": "sidereal",
+                "house_system": tropical_settings.get("house_system"),
+                **series.settings,
+            },
+            "ayanamsa_deg": ayan,
+            "angles": _sidereal_block(western_tropical.get("angles", {}), ayan, with_nakshatra=False),
+            "points": _sidereal_block(western_tropical.get("points", {}), ayan, with_nakshatra=True),
+        }
+
+
+def compute_vedic_sidereal_batch(
+    charts: Iterable[Tuple[float, Mapping[str, Any]]],
+    *,
+    ayanamsa: Optional[AyanamsaSeries] = None,
+) -> List[Dict[str, Any]]:
+    """Many charts at once: (jd_ut, western_tropical) pairs sharing one ayanamsa series."""
+    series = ayanamsa or default_ayanamsa_series()
+    return [compute_vedic_sidereal_layer(wt, jd_ut=jd, ayanamsa=series) for jd, wt in charts]
+
+
+def sidereal_lons_batch(
+    jds: Sequence[float],
+    tropical_lons: Sequence[float],
+    *,
+    ayanamsa: Optional[AyanamsaSeries] = None,
+) -> List[float]:
+    """Columnar form: one tropical longitude per JD (e.g. every Moon in a cohort)."""
+    if len(jds) != len(tropical_lons):
+        raise ValueError("jds and tropical_lons must have the same length")
+    series = ayanamsa or default_ayanamsa_series()
+    return [normalize_deg(lon - series(jd)) for jd, lon in zip(jds, tropical_lons)]
@@ -0,0 +1,10 @@
+"""
+Aethos correlation — journal × timing overlays (scaffold).
+"""
+"""
+Correlation Layer
+
+Descriptive (never causal) overlays between journal signals and timing data:
+- mood vs intensity (day-level)
+- tag frequency by intensity tier
+"""
@@ -0,0 +1,424 @@
+"""
+engine.py — Aethos V1 (Scaffold)
+
+Purpose:
+- Keep per-user correlation accumulators up to date incrementally instead of
+  rescanning journal_entries ⋈ daily_activations for every summary.
+- V1 overlays (see 06_ARCHITECTURE_ONEPAGER §6.2):
+  - mood vs intensity (day-level, Welford mean/variance/covariance → Pearson r)
+  - tag frequency split by intensity tier
+
+Model:
+- Days are joined on the user's LOCAL date (YYYY-MM-DD). A day's mood is the
+  mean of that day's journal entries; its intensity is the daily_activations
+  summary.overall_intensity for that date.
+- A journal entry or activation day updates the day, retracts the day's old
+  contribution and adds the new one: O(1) per event (O(tags) for tags).
+- Every contribution lands in three accumulators: all-time, ISO week, month.
+  Weekly/monthly summaries are read straight from those.
+
+Language rule:
+- Associations are labeled "descriptive". Never claim causality.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from math import sqrt
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+CORRELATION_ENGINE_VERSION = "0.1.1-scaffold"
+
+# overall_intensity is 0..1; tier = first threshold the value reaches.
+INTENSITY_TIERS: Tuple[Tuple[str, float], ...] = (
+    ("high", 0.66),
+    ("medium", 0.33),
+    ("low", 0.0),
+)
+
+PERIOD_TYPES = ("week", "month", "all")
+
+
+def intensity_tier(intensity: float) -> str:
+    for name, threshold in INTENSITY_TIERS:
+        if intensity >= threshold:
+            return name
+    return INTENSITY_TIERS[-1][0]
+
+
+def period_keys(date_local: str) -> Dict[str, str]:
+    d = date.fromisoformat(date_local)
+    iso_year, iso_week, _ = d.isocalendar()
+    return {
+        "week": f"{iso_year}-W{iso_week:02d}",
+        "month": f"{d.year}-{d.month:02d}",
+        "all": "all",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Online Statistics (Welford, with removal)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RunningStats:
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean_old = (self.n * self.mean - x) / (self.n - 1)
+        self.m2 -= (x - mean_old) * (x - self.mean)
+        self.mean = mean_old
+        self.n -= 1
+
+    @property
+    def variance(self) -> Optional[float]:
+        return self.m2 / (self.n - 1) if self.n > 1 else None
+
+
+@dataclass
+class RunningCovariance:
+    n: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0
+    m2_y: float = 0.0
+    c_xy: float = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def remove(self, x: float, y: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.c_xy = 0, 0.0, 0.0, 0.0, 0.0, 0.0
+            return
+        mx_old = (self.n * self.mean_x - x) / (self.n - 1)
+        my_old = (self.n * self.mean_y - y) / (self.n - 1)
+        self.m2_x -= (x - mx_old) * (x - self.mean_x)
+        self.m2_y -= (y - my_old) * (y - self.mean_y)
+        self.c_xy -= (x - mx_old) * (y - self.mean_y)
+        self.mean_x, self.mean_y = mx_old, my_old
+        self.n -= 1
+
+    @property
+    def covariance(self) -> Optional[float]:
+        return self.c_xy / (self.n - 1) if self.n > 1 else None
+
+    def pearson(self) -> Optional[float]:
+        if self.n < 2 or self.m2_x <= 0.0 or self.m2_y <= 0.0:
+            return None
+        r = self.c_xy / sqrt(self.m2_x * self.m2_y)
+        return max(-1.0, min(1.0, r))
+
+
+# ---------------------------------------------------------------------------
+# Accumulators
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CorrelationAccumulator:
+    """Everything a week / month / all-time summary needs, kept online."""
+
+    entries_count: int = 0
+    mood: RunningStats = field(default_factory=RunningStats)             # day-mean mood
+    intensity: RunningStats = field(default_factory=RunningStats)        # day intensity
+    mood_intensity: RunningCovariance = field(default_factory=RunningCovariance)
+    tier_days: Dict[str, int] = field(default_factory=dict)
+    tag_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)  # tier -> tag -> count
+
+    def apply(self, day: "DayState", sign: int) -> None:
+        """Add (sign=+1) or retract (sign=-1) one day's contribution."""
+        mood = day.mood_mean
+        intensity = day.intensity
+        self.entries_count += sign * day.entries_n
+
+        if mood is not None:
+            (self.mood.add if sign > 0 else self.mood.remove)(mood)
+        if intensity is None:
+            return
+
+        (self.intensity.add if sign > 0 else self.intensity.remove)(intensity)
+        if mood is not None:
+            (self.mood_intensity.add if sign > 0 else self.mood_intensity.remove)(mood, intensity)
+
+        tier = intensity_tier(intensity)
+        days = self.tier_days.get(tier, 0) + sign
+        if days:
+            self.tier_days[tier] = days
+        else:
+            self.tier_days.pop(tier, None)
+        if day.tags:
+            counts = self.tag_counts.setdefault(tier, {})
+            for tag in day.tags:
+                c = counts.get(tag, 0) + sign
+                if c:
+                    counts[tag] = c
+                else:
+                    counts.pop(tag, None)
+
+    def summary(self, top_n: int = 5) -> Dict[str, Any]:
+        high_tags = sorted(self.tag_counts.get("high", {}).items(), key=lambda kv: (-kv[1], kv[0]))
+        r = self.mood_intensity.pearson()
+        return {
+            "entries_count": self.entries_count,
+            "days_with_mood": self.mood.n,
+            "days_with_intensity": self.intensity.n,
+            "avg_mood": round(self.mood.mean, 4) if self.mood.n else None,
+            "avg_intensity": round(self.intensity.mean, 4) if self.intensity.n else None,
+            "intensity_tier_days": dict(sorted(self.tier_days.items())),
+            "top_tags_high_intensity": [{"tag": t, "count": c} for t, c in high_tags[:top_n]],
+            "associations": [
+                {
+                    "label": "mood_vs_intensity",
+                    "value": round(r, 4) if r is not None else None,
+                    "n_days": self.mood_intensity.n,
+                    "type": "descriptive",
+                }
+            ],
+        }
+
+
+@dataclass
+class DayState:
+    entries_n: int = 0                  # journal entries, with or without a mood
+    mood_sum: float = 0.0
+    mood_n: int = 0
+    intensity: Optional[float] = None
+    tags: List[str] = field(default_factory=list)
+
+    @property
+    def mood_mean(self) -> Optional[float]:
+        return self.mood_sum / self.mood_n if self.mood_n else None
+
+
+@dataclass
+class UserCorrelationState:
+    days: Dict[str, DayState] = field(default_factory=dict)
+    periods: Dict[str, Dict[str, CorrelationAccumulator]] = field(
+        default_factory=lambda: {p: {} for p in PERIOD_TYPES}
+    )
+
+    def _accumulators(self, date_local: str) -> List[CorrelationAccumulator]:
+        return [
+            self.periods[p].setdefault(key, CorrelationAccumulator())
+            for p, key in period_keys(date_local).items()
+        ]
+
+    def update_day(self, date_local: str, **changes: Any) -> None:
+        day = self.days.get(date_local)
+        accs = self._accumulators(date_local)
+        if day is None:
+            day = self.days[date_local] = DayState()
+        else:
+            for acc in accs:
+                acc.apply(day, -1)
+
+        if changes.get("entry"):
+            day.entries_n += 1
+        if "mood" in changes:
+            day.mood_sum += float(changes["mood"])
+            day.mood_n += 1
+        if "tags" in changes:
+            day.tags.extend(str(t) for t in changes["tags"])
+        if "intensity" in changes:
+            day.intensity = None if changes["intensity"] is None else float(changes["intensity"])
+
+        for acc in accs:
+            acc.apply(day, +1)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+def journal_date_local(created_at_local: Any) -> str:
+    """journal_entries.created_at_local (datetime or ISO text) -> local YYYY-MM-DD."""
+    if isinstance(created_at_local, datetime):
+        return created_at_local.date().isoformat()
+    if isinstance(created_at_local, date):
+        return created_at_local.isoformat()
+    return date.fromisoformat(str(created_at_local)[:10]).isoformat()
+
+
+def _tag_list(value: Any) -> List[str]:
+    """journal_entries.tag_list: text[] / JSONB array, possibly still JSON text."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = json.loads(value)
+    return [str(t) for t in value]
+
+
+def intensity_from_payload(payload: Mapping[str, Any]) -> Optional[float]:
+    """Pull summary.overall_intensity out of a daily_activations payload_json."""
+    summary = payload.get("summary") or {}
+    value = summary.get("overall_intensity")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class CorrelationEngine:
+    """
+    Per-user streaming correlation state.
+
+    Feed it events as they happen (on_journal_entry / on_activation_day), or
+    rebuild a user from history (rebuild_user). Read summaries at any time.
+    """
+
+    def __init__(self) -> None:
+        self._users: Dict[str, UserCorrelationState] = {}
+
+    def _state(self, user_id: str) -> UserCorrelationState:
+        state = self._users.get(user_id)
+        if state is None:
+            state = self._users[user_id] = UserCorrelationState()
+        return state
+
+    # ---- incremental updates -------------------------------------------
+
+    def on_journal_entry(
+        self,
+        user_id: str,
+        date_local: str,
+        mood: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        changes: Dict[str, Any] = {"entry": True, "tags": list(tags)}
+        if mood is not None:
+            changes["mood"] = mood
+        self._state(user_id).update_day(date_local, **changes)
+
+    def on_activation_day(self, user_id: str, date_local: str, overall_intensity: Optional[float]) -> None:
+        """Record (or replace, on recompute) a day's intensity."""
+        self._state(user_id).update_day(date_local, intensity=overall_intensity)
+
+    # ---- batch rebuild ---------------------------------------------------
+
+    def rebuild_user(
+        self,
+        user_id: str,
+        journal_rows: Iterable[Mapping[str, Any]],
+        activation_rows: Iterable[Mapping[str, Any]],
+    ) -> None:
+        """
+        Reset a user and replay history.
+
+        journal_rows:    journal_entries rows (04_DATA_MODEL §5): the local day
+                         is taken from created_at_local; mood and tag_list may
+                         be null.
+        activation_rows: {"date_local", "payload_json"} (daily_activations,
+                         dated in the user's local calendar)
+        """
+        self._users.pop(user_id, None)
+        for row in activation_rows:
+            self.on_activation_day(user_id, row["date_local"], intensity_from_payload(row["payload_json"]))
+        for row in journal_rows:
+            self.on_journal_entry(
+                user_id, journal_date_local(row["created_at_local"]), row.get("mood"), _tag_list(row.get("tag_list"))
+            )
+
+    # ---- reads -------------------------------------------------------------
+
+    def summary(self, user_id: str, period_type: str, period_key: str = "all") -> Dict[str, Any]:
+        """
+        Summary payload for one period (shape follows correlation_summaries.payload).
+
+        period_type ∈ week | month | all; period_key e.g. "2026-W07", "2026-02".
+        """
+        if period_type not in PERIOD_TYPES:
+            raise ValueError(f"period_type must be one of {PERIOD_TYPES}; got {period_type!r}")
+        acc = self._state(user_id).periods[period_type].get(period_key) or CorrelationAccumulator()
+        return {
+            "period_type": period_type,
+            "period_key": period_key,
+            "correlation_engine_version": CORRELATION_ENGINE_VERSION,
+            **acc.summary(),
+        }
+
+    # ---- persistence -------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": CORRELATION_ENGINE_VERSION,
+            "users": {uid: _state_to_dict(s) for uid, s in self._users.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CorrelationEngine":
+        if data.get("version") != CORRELATION_ENGINE_VERSION:
+            raise ValueError(
+                f"Correlation state version {data.get('version')!r} != {CORRELATION_ENGINE_VERSION!r}; "
+                "rebuild from history instead."
+            )
+        engine = cls()
+        for uid, s in data.get("users", {}).items():
+            engine._users[uid] = _state_from_dict(s)
+        return engine
+
+
+def _acc_to_dict(acc: CorrelationAccumulator) -> Dict[str, Any]:
+    return {
+        "entries_count": acc.entries_count,
+        "mood": vars(acc.mood).copy(),
+        "intensity": vars(acc.intensity).copy(),
+        "mood_intensity": vars(acc.mood_intensity).copy(),
+        "tier_days": dict(acc.tier_days),
+        "tag_counts": {tier: dict(c) for tier, c in acc.tag_counts.items()},
+    }
+
+
+def _acc_from_dict(d: Mapping[str, Any]) -> CorrelationAccumulator:
+    return CorrelationAccumulator(
+        entries_count=int(d["entries_count"]),
+        mood=RunningStats(**d["mood"]),
+        intensity=RunningStats(**d["intensity"]),
+        mood_intensity=RunningCovariance(**d["mood_intensity"]),
+        tier_days=dict(d["tier_days"]),
+        tag_counts={tier: dict(c) for tier, c in d["tag_counts"].items()},
+    )
+
+
+def _state_to_dict(state: UserCorrelationState) -> Dict[str, Any]:
+    return {
+        "days": {
+            k: {
+                "entries_n": d.entries_n,
+                "mood_sum": d.mood_sum,
+                "mood_n": d.mood_n,
+                "intensity": d.intensity,
+                "tags": list(d.tags),
+            }
+            for k, d in state.days.items()
+        },
+        "periods": {p: {k: _acc_to_dict(a) for k, a in accs.items()} for p, accs in state.periods.items()},
+    }
+
+
+def _state_from_dict(d: Mapping[str, Any]) -> UserCorrelationState:
+    state = UserCorrelationState()
+    state.days = {
+        k: DayState(entries_n=int(v["entries_n"]), mood_sum=float(v["mood_sum"]),
+                    mood_n=int(v["mood_n"]), intensity=v["intensity"], tags=list(v["tags"]))
+        for k, v in d["days"].items()
+    }
+    for p, accs in d["periods"].items():
+        state.periods[p] = {k: _acc_from_dict(a) for k, a in accs.items()}
+    return state
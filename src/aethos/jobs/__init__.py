@@ -0,0 +1,10 @@
+"""
+Aethos jobs — offline batch operations over stored profiles (scaffold).
+"""
+"""
+Jobs Layer
+
+Long-running, resumable operations that run outside the request path:
+- store (local SQLite stand-in for birth_profiles / system_profiles + job checkpoints)
+- reversion (re-run calculators after an engine_version bump, diff, write back)
+"""
@@ -0,0 +1,580 @@
+"""
+reversion.py — Aethos V1 (Scaffold)
+
+Purpose:
+- After an engine_version bump (06_ARCHITECTURE_ONEPAGER: "Changes to algorithms
+  require version bump and regression tests"), re-run the profile pipeline
+    compute_canonical_chart → compute_human_design_layer → compute_gene_keys_layer
+  over every stored profile, diff against the stored system_profiles payloads,
+  and write the new payloads back.
+
+Model:
+- Layers (systems) form a chain: western_tropical → human_design → gene_keys.
+  A layer is recomputed when its stored engine_version differs from the code's,
+  when it is missing, when it is forced, or when a layer it depends on was
+  recomputed and its payload actually changed. Untouched layers are never
+  deserialized unless a recomputed layer downstream needs them as input.
+- Payloads are compared by canonical content hash; only differing payloads are
+  walked by diff_payloads, which yields a structured summary (changed / added /
+  removed paths, capped list of examples).
+- birth_profiles is split into contiguous profile_id ranges (shards). Worker
+  processes read a batch from their shard's cursor and return rows; the
+  coordinator writes each batch's payloads, diffs and the shard cursor in one
+  transaction. A run killed at any point resumes from the last committed batch
+  with the same run_id; rewriting a batch is idempotent.
+- Progress (profiles/s, ETA) is reported while the run is going; the final
+  ReversionReport carries per-system status counts and the most frequently
+  changed paths.
+
+Dry runs compute and record diffs without touching system_profiles, which is
+the way to review a version bump before shipping it.
+
+Usage:
+  python -m aethos.jobs.reversion --db profiles.sqlite --ephemeris my_ephemeris \\
+      --init my_setup:install_gate_wheel --workers 8 --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from math import isfinite
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..calculators import canonical_chart, canonical_output, gene_keys, human_design
+from . import store
+
+SYSTEMS: Tuple[str, ...] = ("western_tropical", "human_design", "gene_keys")
+UPSTREAM: Dict[str, Tuple[str, ...]] = {
+    "western_tropical": (),
+    "human_design": ("western_tropical",),
+    "gene_keys": ("human_design",),
+}
+
+HD_POINTS: Tuple[str, ...] = (
+    "Sun", "Earth", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto",
+)
+
+# Keys that carry the version itself; the version change is recorded per row, not as a diff path.
+DIFF_IGNORE: FrozenSet[str] = frozenset({"engine_version", "computed_at"})
+DIFF_TOL = 10.0 ** -canonical_output.FLOAT_DECIMALS
+MAX_DIFF_PATHS = 20
+
+
+def current_versions() -> Dict[str, str]:
+    return {
+        "western_tropical": canonical_chart.ENGINE_VERSION,
+        "human_design": human_design.ENGINE_VERSION,
+        "gene_keys": gene_keys.ENGINE_VERSION,
+    }
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _resolve(spec: str) -> Any:
+    """'package.module:attr' -> attr."""
+    module, _, attr = spec.partition(":")
+    obj = importlib.import_module(module)
+    return getattr(obj, attr) if attr else obj
+
+
+# ---------------------------------------------------------------------------
+# Ephemeris Injection
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Ephemeris:
+    """
+    Position sources for the pipeline. Every callable must be a module-level
+    function so it pickles by reference into worker processes.
+    """
+    natal_at: Callable[[float, float, float], Mapping[str, float]]   # (jd_ut, lat, lon) -> planets + angles
+    sun_lon_at: Callable[[float], float]
+    positions_at: Callable[[float], Mapping[str, float]]
+
+    @classmethod
+    def from_module(cls, name: str) -> "Ephemeris":
+        """Module exposing natal_chart(jd, lat, lon), sun_lon_at(jd), positions_at(jd)."""
+        m = importlib.import_module(name)
+        return cls(natal_at=m.natal_chart, sun_lon_at=m.sun_lon_at, positions_at=m.positions_at)
+
+
+# ---------------------------------------------------------------------------
+# Layer Pipeline
+# ---------------------------------------------------------------------------
+
+def _hd_positions(lons: Mapping[str, Optional[float]]) -> Dict[str, float]:
+    pos = {k: float(lons[k]) for k in HD_POINTS if lons.get(k) is not None}
+    if "Sun" in pos:
+        pos["Earth"] = (pos["Sun"] + 180.0) % 360.0
+    return pos
+
+
+def compute_western_layer(row: store.BirthRow, ephemeris: Ephemeris) -> Dict[str, Any]:
+    birth = canonical_chart.BirthInput(
+        local_datetime=row.local_datetime,
+        timezone=row.tzid,
+        lat=row.lat,
+        lon=row.lon,
+        place_label=row.place_label,
+        birth_time_confidence=row.birth_time_confidence,
+    )
+    chart = canonical_chart.compute_canonical_chart(birth)
+    western = chart["western_tropical"]
+
+    # birth_profiles is the canonical truth source (04_DATA_MODEL §2); the
+    # stored JD is used until canonical_chart performs the conversion itself.
+    jd_ut = chart["birth_profile"]["jd_ut"]
+    if not isinstance(jd_ut, float):
+        jd_ut = row.julian_day_ut
+    if jd_ut is None:
+        raise ValueError(f"profile {row.profile_id} has no julian_day_ut")
+
+    lons = ephemeris.natal_at(jd_ut, row.lat, row.lon)
+    for name, point in western["points"].items():
+        if point.get("lon") is None and name in lons:
+            point["lon"] = float(lons[name])
+    if row.birth_time_confidence != "unknown":
+        for name, angle in western["angles"].items():
+            if angle.get("lon") is None and name in lons:
+                angle["lon"] = float(lons[name])
+    western["jd_ut"] = jd_ut
+    return western
+
+
+def compute_hd_layer(western: Mapping[str, Any], ephemeris: Ephemeris) -> Dict[str, Any]:
+    positions_at = ephemeris.positions_at
+    return human_design.compute_human_design_layer(
+        birth_jd_ut=western["jd_ut"],
+        positions_birth=_hd_positions({k: v.get("lon") for k, v in western["points"].items()}),
+        sun_lon_at=ephemeris.sun_lon_at,
+        compute_positions_at_jd=lambda jd: _hd_positions(positions_at(jd)),
+    )
+
+
+def compute_gene_keys_payload(hd: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "engine_version": gene_keys.ENGINE_VERSION,
+        "personality": gene_keys.compute_gene_keys_layer(hd["personality"]["activations"]),
+        "design": gene_keys.compute_gene_keys_layer(hd["design"]["activations"]),
+    }
+
+
+def _compute(system: str, row: store.BirthRow, inputs: Mapping[str, Any], ephemeris: Ephemeris) -> Dict[str, Any]:
+    if system == "western_tropical":
+        return compute_western_layer(row, ephemeris)
+    if system == "human_design":
+        return compute_hd_layer(inputs["western_tropical"], ephemeris)
+    return compute_gene_keys_payload(inputs["human_design"])
+
+
+# ---------------------------------------------------------------------------
+# Structured Diff
+# ---------------------------------------------------------------------------
+
+def _same_leaf(a: Any, b: Any, tol: float) -> bool:
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        if isfinite(a) and isfinite(b):
+            return abs(a - b) <= tol
+    return a == b
+
+
+def _walk(old: Any, new: Any, path: str, tol: float, out: List[Tuple[str, str, Any, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for k in sorted(old.keys() | new.keys()):
+            if not path and k in DIFF_IGNORE:
+                continue
+            sub = f"{path}.{k}" if path else str(k)
+            if k not in new:
+                out.append(("removed", sub, old[k], None))
+            elif k not in old:
+                out.append(("added", sub, None, new[k]))
+            else:
+                _walk(old[k], new[k], sub, tol, out)
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (a, b) in enumerate(zip(old, new)):
+            _walk(a, b, f"{path}[{i}]", tol, out)
+    elif not _same_leaf(old, new, tol):
+        out.append(("changed", path, old, new))
+
+
+def diff_payloads(
+    old: Any, new: Any, *, tol: float = DIFF_TOL, max_paths: int = MAX_DIFF_PATHS
+) -> Dict[str, Any]:
+    """
+    Structured diff of two JSON-shaped payloads:
+      {"changed": n, "added": n, "removed": n, "paths": [{"op", "path", "old", "new"}, ...]}
+    Paths are dotted keys with [i] for list items; numbers within tol are equal;
+    top-level engine_version/computed_at are ignored. At most max_paths examples.
+    """
+    ops: List[Tuple[str, str, Any, Any]] = []
+    _walk(old, new, "", tol, ops)
+    tally = Counter(op for op, _, _, _ in ops)
+    return {
+        "changed": tally["changed"],
+        "added": tally["added"],
+        "removed": tally["removed"],
+        "paths": [{"op": op, "path": p, "old": a, "new": b} for op, p, a, b in ops[:max_paths]],
+        "truncated": len(ops) > max_paths,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Worker: one batch of one shard
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Plan:
+    run_id: str
+    db_path: str
+    versions: Mapping[str, str]
+    force: FrozenSet[str]
+    dry_run: bool
+    computed_at: str
+    ephemeris: Ephemeris
+    batch_size: int
+
+
+@dataclass
+class BatchResult:
+    shard: int
+    cursor: Optional[str]
+    profiles: int
+    done: bool
+    system_rows: List[store.SystemRow] = field(default_factory=list)
+    diff_rows: List[store.DiffRow] = field(default_factory=list)
+
+
+_WORKER_CONN: Dict[str, sqlite3.Connection] = {}
+
+
+def _init_worker(initializer: Optional[Callable[[], None]]) -> None:
+    if initializer is not None:
+        initializer()
+
+
+def _reader(db_path: str) -> sqlite3.Connection:
+    conn = _WORKER_CONN.get(db_path)
+    if conn is None:
+        conn = _WORKER_CONN[db_path] = store.connect(db_path, readonly=True)
+    return conn
+
+
+def reversion_profile(
+    plan: Plan, row: store.BirthRow, stored: Mapping[str, store.StoredPayload], out: BatchResult
+) -> None:
+    """Recompute the stale layers of one profile; append system rows and diff rows to out."""
+    inputs: Dict[str, Any] = {}
+    changed: set = set()
+    for system in SYSTEMS:
+        old = stored.get(system)
+        version = plan.versions[system]
+        deps = UPSTREAM[system]
+        if not (
+            system in plan.force
+            or old is None
+            or old.engine_version != version
+            or any(d in changed for d in deps)
+        ):
+            continue
+        for d in deps:
+            if d not in inputs:
+                inputs[d] = stored[d].load()
+        try:
+            payload = canonical_output.canonicalize(_compute(system, row, inputs, plan.ephemeris))
+        except Exception as exc:  # one bad profile must not stop the run
+            summary = {"error": f"{type(exc).__name__}: {exc}"}
+            out.diff_rows.append((
+                plan.run_id, row.profile_id, system, "error",
+                old.engine_version if old else None, version, json.dumps(summary),
+            ))
+            return  # every later layer depends on this one
+        inputs[system] = json.loads(payload.body)
+
+        if old is None:
+            status, summary = "new", {}
+        elif old.payload_hash == payload.digest:
+            status, summary = "unchanged", {}
+        else:
+            status, summary = "changed", diff_payloads(old.load(), inputs[system])
+        if status != "unchanged":
+            changed.add(system)
+        out.diff_rows.append((
+            plan.run_id, row.profile_id, system, status,
+            old.engine_version if old else None, version, json.dumps(summary, sort_keys=True),
+        ))
+        out.system_rows.append((row.profile_id, system, version, payload.digest, payload.body, plan.computed_at))
+
+
+def run_batch(plan: Plan, shard: int, cursor: Optional[str], hi: Optional[str]) -> BatchResult:
+    conn = _reader(plan.db_path)
+    rows = store.load_birth_profiles(conn, cursor, hi, plan.batch_size)
+    done = len(rows) < plan.batch_size
+    if not rows:
+        return BatchResult(shard=shard, cursor=cursor, profiles=0, done=True)
+
+    last = rows[-1].profile_id
+    stored = store.load_system_profiles(conn, cursor, last, SYSTEMS)
+    out = BatchResult(shard=shard, cursor=last, profiles=len(rows), done=done)
+    for row in rows:
+        reversion_profile(plan, row, stored.get(row.profile_id, {}), out)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Progress
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Progress:
+    total: int                      # profiles in the run
+    done: int                       # profiles committed (includes earlier sessions)
+    started: float = field(default_factory=time.perf_counter)
+    session: int = 0                # profiles committed by this process
+
+    def add(self, n: int) -> None:
+        self.done += n
+        self.session += n
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Profiles per second over this session."""
+        elapsed = self.elapsed_s
+        return self.session / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_s(self) -> Optional[float]:
+        rate = self.rate
+        return (self.total - self.done) / rate if rate > 0 else None
+
+    def line(self) -> str:
+        pct = 100.0 * self.done / self.total if self.total else 100.0
+        eta = self.eta_s
+        eta_txt = "--:--:--" if eta is None else _hms(eta)
+        return f"{self.done}/{self.total} profiles ({pct:.1f}%)  {self.rate:.1f}/s  elapsed {_hms(self.elapsed_s)}  eta {eta_txt}"
+
+
+def _hms(seconds: float) -> str:
+    s = int(round(seconds))
+    return f"{s // 3600:02d}:{s % 3600 // 60:02d}:{s % 60:02d}"
+
+
+def print_progress(progress: Progress) -> None:
+    print(progress.line(), file=sys.stderr, flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Coordinator
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReversionReport:
+    run_id: str
+    dry_run: bool
+    resumed: bool
+    versions: Dict[str, str]
+    total_profiles: int
+    session_profiles: int
+    elapsed_s: float
+    profiles_per_s: float
+    statuses: Dict[str, Dict[str, int]]          # system -> status -> count (whole run)
+    top_changed_paths: List[Tuple[str, int]]     # (system:path, profiles), from the capped examples
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _commit(conn: sqlite3.Connection, plan: Plan, res: BatchResult) -> None:
+    with conn:
+        if not plan.dry_run:
+            store.upsert_system_profiles(conn, res.system_rows)
+        store.insert_diffs(conn, res.diff_rows)
+        store.advance_shard(conn, plan.run_id, res.shard, res.cursor, res.profiles, res.done)
+
+
+def _top_paths(conn: sqlite3.Connection, run_id: str, limit: int = 10) -> List[Tuple[str, int]]:
+    tally: Counter = Counter()
+    for _, system, summary in store.diff_summaries(conn, run_id, "changed"):
+        tally.update({f"{system}:{p['path']}" for p in summary.get("paths", ())})
+    return tally.most_common(limit)
+
+
+def run_reversion(
+    db_path: str,
+    *,
+    ephemeris: Ephemeris,
+    run_id: Optional[str] = None,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    batch_size: int = 500,
+    force: Iterable[str] = (),
+    dry_run: bool = False,
+    initializer: Optional[Callable[[], None]] = None,
+    on_progress: Optional[Callable[[Progress], None]] = print_progress,
+    progress_every_s: float = 5.0,
+) -> ReversionReport:
+    """
+    Run (or resume) a re-version job over db_path.
+
+    - run_id: resume that run if it exists (its force/dry_run settings win);
+      otherwise start a new run under that id.
+    - workers: processes; 0 or 1 runs batches in this process.
+    - shards: profile_id ranges (default 4 per worker, so a slow range does
+      not hold the run's tail on one process).
+    - initializer: module-level callable run once in every worker before any
+      batch (e.g. load the HD gate wheel); also run here when workers <= 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    versions = current_versions()
+    force_set = frozenset(force)
+    unknown = force_set - set(SYSTEMS)
+    if unknown:
+        raise ValueError(f"unknown systems: {sorted(unknown)}")
+    run_id = run_id or str(uuid.uuid4())
+
+    conn = store.connect(db_path)
+    config = store.load_run(conn, run_id)
+    resumed = config is not None
+    if resumed:
+        if config["versions"] != versions:
+            raise ValueError(
+                f"run {run_id!r} targets {config['versions']}, code is at {versions}; start a new run"
+            )
+        force_set, dry_run = frozenset(config["force"]), config["dry_run"]
+    else:
+        config = {"versions": versions, "force": sorted(force_set), "dry_run": dry_run}
+        with conn:
+            bounds = store.shard_bounds(conn, shards or 4 * max(1, workers))
+            store.create_run(conn, run_id, config, bounds, _utc_now())
+
+    plan = Plan(
+        run_id=run_id,
+        db_path=db_path,
+        versions=versions,
+        force=force_set,
+        dry_run=dry_run,
+        computed_at=_utc_now(),
+        ephemeris=ephemeris,
+        batch_size=batch_size,
+    )
+    states = store.load_shards(conn, run_id)
+    progress = Progress(total=sum(s.total for s in states), done=sum(s.processed for s in states))
+    pending = [s for s in states if not s.done]
+    hi_of = {s.shard: s.hi for s in states}
+    last_report, reported = time.perf_counter(), -1
+
+    def committed(res: BatchResult) -> None:
+        nonlocal last_report, reported
+        _commit(conn, plan, res)
+        progress.add(res.profiles)
+        now = time.perf_counter()
+        if on_progress is not None and now - last_report >= progress_every_s:
+            last_report, reported = now, progress.done
+            on_progress(progress)
+
+    if workers <= 1:
+        _init_worker(initializer)
+        for s in pending:
+            cursor, done = s.cursor, False
+            while not done:
+                res = run_batch(plan, s.shard, cursor, s.hi)
+                committed(res)
+                cursor, done = res.cursor, res.done
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(initializer,)) as pool:
+            # One batch in flight per shard keeps each shard's cursor strictly ordered.
+            inflight: Dict[Future, int] = {
+                pool.submit(run_batch, plan, s.shard, s.cursor, s.hi): s.shard for s in pending
+            }
+            while inflight:
+                finished, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    del inflight[fut]
+                    res = fut.result()
+                    committed(res)
+                    if not res.done:
+                        inflight[pool.submit(run_batch, plan, res.shard, res.cursor, hi_of[res.shard])] = res.shard
+
+    with conn:
+        store.finish_run(conn, run_id, _utc_now())
+    if on_progress is not None and reported != progress.done:
+        on_progress(progress)
+
+    report = ReversionReport(
+        run_id=run_id,
+        dry_run=dry_run,
+        resumed=resumed,
+        versions=versions,
+        total_profiles=progress.total,
+        session_profiles=progress.session,
+        elapsed_s=round(progress.elapsed_s, 3),
+        profiles_per_s=round(progress.rate, 1),
+        statuses=store.diff_status_counts(conn, run_id),
+        top_changed_paths=_top_paths(conn, run_id),
+    )
+    conn.close()
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Re-run calculators over stored profiles after an engine_version bump")
+    ap.add_argument("--db", required=True, help="SQLite stand-in database")
+    ap.add_argument("--ephemeris", required=True, help="module exposing natal_chart, sun_lon_at, positions_at")
+    ap.add_argument("--init", help="module:function run once per worker (e.g. install the HD gate wheel)")
+    ap.add_argument("--run-id", help="resume this run (or start it under this id)")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: CPU count; 1 = in-process)")
+    ap.add_argument("--shards", type=int, default=None, help="profile_id ranges (default: 4 per worker)")
+    ap.add_argument("--batch-size", type=int, default=500)
+    ap.add_argument("--force", default="", help="comma-separated systems to recompute regardless of version")
+    ap.add_argument("--dry-run", action="store_true", help="record diffs, leave system_profiles untouched")
+    ap.add_argument("--out", help="write the report JSON here")
+    args = ap.parse_args(argv)
+
+    report = run_reversion(
+        args.db,
+        ephemeris=Ephemeris.from_module(args.ephemeris),
+        run_id=args.run_id,
+        workers=args.workers,
+        shards=args.shards,
+        batch_size=args.batch_size,
+        force=[s for s in args.force.split(",") if s],
+        dry_run=args.dry_run,
+        initializer=_resolve(args.init) if args.init else None,
+    )
+
+    print(f"run {report.run_id}{' (dry run)' if report.dry_run else ''}{' (resumed)' if report.resumed else ''}")
+    print(f"  {report.session_profiles} profiles in {report.elapsed_s:.1f}s ({report.profiles_per_s:.1f}/s)")
+    for system in SYSTEMS:
+        counts = report.statuses.get(system, {})
+        print(f"  {system:<17} " + "  ".join(f"{k}={counts[k]}" for k in sorted(counts)) if counts else f"  {system:<17} untouched")
+    for path, n in report.top_changed_paths:
+        print(f"    {n:>8}  {path}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+            f.write("\n")
+    return 1 if any("error" in c for c in report.statuses.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
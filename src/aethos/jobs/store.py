@@ -0,0 +1,317 @@
+"""
+store.py — Aethos V1 (Scaffold)
+
+Purpose:
+- Local SQLite stand-in for the profile tables batch jobs read and write:
+  - birth_profiles (04_DATA_MODEL §2, the columns jobs need)
+  - system_profiles (one row per profile × system: engine_version + payload)
+- Job bookkeeping for resumable runs: reversion_runs, reversion_shards
+  (key-range cursor per shard) and reversion_diffs.
+
+Conventions:
+- Payloads are stored as canonical_output.canonical_dumps bytes with their
+  content_hash, so "did the payload change" is a string compare.
+- Shards are contiguous profile_id ranges (lo, hi]; a shard's cursor is the
+  last profile_id written, so resuming is keyset pagination from the cursor.
+- Writers batch rows into one transaction per call site (`with conn:`);
+  nothing here commits on its own.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS birth_profiles (
+    profile_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    local_datetime TEXT NOT NULL,
+    tzid TEXT NOT NULL,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    place_label TEXT,
+    utc_datetime TEXT,
+    julian_day_ut REAL,
+    birth_time_confidence TEXT NOT NULL DEFAULT 'exact',
+    canonicalization_version TEXT
+);
+CREATE TABLE IF NOT EXISTS system_profiles (
+    profile_id TEXT NOT NULL,
+    system TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    payload_hash TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    computed_at TEXT NOT NULL,
+    PRIMARY KEY (profile_id, system)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS reversion_runs (
+    run_id TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS reversion_shards (
+    run_id TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    lo TEXT,
+    hi TEXT,
+    cursor TEXT,
+    total INTEGER NOT NULL,
+    processed INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, shard)
+);
+CREATE TABLE IF NOT EXISTS reversion_diffs (
+    run_id TEXT NOT NULL,
+    profile_id TEXT NOT NULL,
+    system TEXT NOT NULL,
+    status TEXT NOT NULL,
+    from_version TEXT,
+    to_version TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (run_id, profile_id, system)
+) WITHOUT ROWID;
+"""
+
+BIRTH_COLUMNS: Tuple[str, ...] = (
+    "profile_id",
+    "user_id",
+    "local_datetime",
+    "tzid",
+    "lat",
+    "lon",
+    "place_label",
+    "utc_datetime",
+    "julian_day_ut",
+    "birth_time_confidence",
+    "canonicalization_version",
+)
+BIRTH_DEFAULTS: Dict[str, Any] = {"birth_time_confidence": "exact"}
+
+
+@dataclass(frozen=True)
+class BirthRow:
+    profile_id: str
+    user_id: Optional[str]
+    local_datetime: str
+    tzid: str
+    lat: float
+    lon: float
+    place_label: Optional[str]
+    utc_datetime: Optional[str]
+    julian_day_ut: Optional[float]
+    birth_time_confidence: str
+    canonicalization_version: Optional[str]
+
+
+@dataclass(frozen=True)
+class StoredPayload:
+    engine_version: str
+    payload_hash: str
+    payload: bytes
+
+    def load(self) -> Any:
+        return json.loads(self.payload)
+
+
+# (profile_id, system, engine_version, payload_hash, payload, computed_at)
+SystemRow = Tuple[str, str, str, str, bytes, str]
+
+
+def connect(path: str, *, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Open the stand-in database. WAL lets job workers read their shard while
+    the coordinator writes; readonly connections skip schema setup.
+    """
+    if readonly:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Profiles
+# ---------------------------------------------------------------------------
+
+def insert_birth_profiles(conn: sqlite3.Connection, rows: Iterable[Mapping[str, Any]]) -> None:
+    cols = ", ".join(BIRTH_COLUMNS)
+    marks = ", ".join("?" for _ in BIRTH_COLUMNS)
+    conn.executemany(
+        f"INSERT OR REPLACE INTO birth_profiles ({cols}) VALUES ({marks})",
+        (tuple(r.get(c, BIRTH_DEFAULTS.get(c)) for c in BIRTH_COLUMNS) for r in rows),
+    )
+
+
+def upsert_system_profiles(conn: sqlite3.Connection, rows: Iterable[SystemRow]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO system_profiles "
+        "(profile_id, system, engine_version, payload_hash, payload, computed_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _range_clause(lo: Optional[str], hi: Optional[str]) -> Tuple[str, List[str]]:
+    where, args = [], []
+    if lo is not None:
+        where.append("profile_id > ?")
+        args.append(lo)
+    if hi is not None:
+        where.append("profile_id <= ?")
+        args.append(hi)
+    return (" WHERE " + " AND ".join(where)) if where else "", args
+
+
+def count_profiles(conn: sqlite3.Connection, lo: Optional[str] = None, hi: Optional[str] = None) -> int:
+    clause, args = _range_clause(lo, hi)
+    return conn.execute(f"SELECT COUNT(*) FROM birth_profiles{clause}", args).fetchone()[0]
+
+
+def load_birth_profiles(
+    conn: sqlite3.Connection, lo: Optional[str], hi: Optional[str], limit: int
+) -> List[BirthRow]:
+    clause, args = _range_clause(lo, hi)
+    cur = conn.execute(
+        f"SELECT {', '.join(BIRTH_COLUMNS)} FROM birth_profiles{clause} ORDER BY profile_id LIMIT ?",
+        args + [limit],
+    )
+    return [BirthRow(*r) for r in cur]
+
+
+def load_system_profiles(
+    conn: sqlite3.Connection, lo: Optional[str], hi: Optional[str], systems: Sequence[str]
+) -> Dict[str, Dict[str, StoredPayload]]:
+    """profile_id -> system -> stored payload, for every profile in (lo, hi]."""
+    clause, args = _range_clause(lo, hi)
+    marks = ", ".join("?" for _ in systems)
+    clause = f"{clause} AND system IN ({marks})" if clause else f" WHERE system IN ({marks})"
+    cur = conn.execute(
+        "SELECT profile_id, system, engine_version, payload_hash, payload "
+        f"FROM system_profiles{clause}",
+        args + list(systems),
+    )
+    out: Dict[str, Dict[str, StoredPayload]] = {}
+    for pid, system, version, digest, payload in cur:
+        out.setdefault(pid, {})[system] = StoredPayload(version, digest, payload)
+    return out
+
+
+def shard_bounds(conn: sqlite3.Connection, shards: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Split birth_profiles into <= `shards` contiguous (lo, hi] profile_id ranges
+    of near-equal size. The first lo and last hi are None (open).
+    """
+    total = count_profiles(conn)
+    shards = max(1, min(shards, total))
+    cuts: List[Optional[str]] = [None]
+    for k in range(1, shards):
+        row = conn.execute(
+            "SELECT profile_id FROM birth_profiles ORDER BY profile_id LIMIT 1 OFFSET ?",
+            (k * total // shards - 1,),
+        ).fetchone()
+        if row is not None and row[0] != cuts[-1]:
+            cuts.append(row[0])
+    cuts.append(None)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+# ---------------------------------------------------------------------------
+# Run bookkeeping
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ShardState:
+    shard: int
+    lo: Optional[str]
+    hi: Optional[str]
+    cursor: Optional[str]
+    total: int
+    processed: int
+    done: bool
+
+
+def load_run(conn: sqlite3.Connection, run_id: str) -> Optional[Dict[str, Any]]:
+    row = conn.execute("SELECT config FROM reversion_runs WHERE run_id = ?", (run_id,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def create_run(
+    conn: sqlite3.Connection,
+    run_id: str,
+    config: Mapping[str, Any],
+    bounds: Sequence[Tuple[Optional[str], Optional[str]]],
+    started_at: str,
+) -> None:
+    conn.execute(
+        "INSERT INTO reversion_runs (run_id, config, started_at) VALUES (?, ?, ?)",
+        (run_id, json.dumps(config, sort_keys=True), started_at),
+    )
+    conn.executemany(
+        "INSERT INTO reversion_shards (run_id, shard, lo, hi, cursor, total) VALUES (?, ?, ?, ?, ?, ?)",
+        ((run_id, k, lo, hi, lo, count_profiles(conn, lo, hi)) for k, (lo, hi) in enumerate(bounds)),
+    )
+
+
+def load_shards(conn: sqlite3.Connection, run_id: str) -> List[ShardState]:
+    cur = conn.execute(
+        "SELECT shard, lo, hi, cursor, total, processed, done FROM reversion_shards "
+        "WHERE run_id = ? ORDER BY shard",
+        (run_id,),
+    )
+    return [ShardState(s, lo, hi, c, t, p, bool(d)) for s, lo, hi, c, t, p, d in cur]
+
+
+def advance_shard(
+    conn: sqlite3.Connection, run_id: str, shard: int, cursor: Optional[str], processed: int, done: bool
+) -> None:
+    conn.execute(
+        "UPDATE reversion_shards SET cursor = ?, processed = processed + ?, done = ? "
+        "WHERE run_id = ? AND shard = ?",
+        (cursor, processed, int(done), run_id, shard),
+    )
+
+
+def finish_run(conn: sqlite3.Connection, run_id: str, finished_at: str) -> None:
+    conn.execute("UPDATE reversion_runs SET finished_at = ? WHERE run_id = ?", (finished_at, run_id))
+
+
+# (run_id, profile_id, system, status, from_version, to_version, summary)
+DiffRow = Tuple[str, str, str, str, Optional[str], str, str]
+
+
+def insert_diffs(conn: sqlite3.Connection, rows: Iterable[DiffRow]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO reversion_diffs "
+        "(run_id, profile_id, system, status, from_version, to_version, summary) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def diff_status_counts(conn: sqlite3.Connection, run_id: str) -> Dict[str, Dict[str, int]]:
+    """system -> status -> count for a run."""
+    out: Dict[str, Dict[str, int]] = {}
+    cur = conn.execute(
+        "SELECT system, status, COUNT(*) FROM reversion_diffs WHERE run_id = ? GROUP BY system, status",
+        (run_id,),
+    )
+    for system, status, n in cur:
+        out.setdefault(system, {})[status] = n
+    return out
+
+
+def diff_summaries(conn: sqlite3.Connection, run_id: str, status: str) -> Iterable[Tuple[str, str, Dict[str, Any]]]:
+    cur = conn.execute(
+        "SELECT profile_id, system, summary FROM reversion_diffs WHERE run_id = ? AND status = ?",
+        (run_id, status),
+    )
+    for pid, system, summary in cur:
+        yield pid, system, json.loads(summary)
@@ -0,0 +1,446 @@
+# notification_scheduler.py
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from math import floor
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from aethos.calculators.instrumentation import count, span
+
+from .transits_engine import PLANETS, ASPECTS, normalize_deg, compute_transits_frame
+from .timing_events import ANGLE_KEYS, ang_diff_signed, aspect_hardness, natal_points_from_profile
+
+# =====================================================
+# Next-Event Scheduler (exact aspects + angle crossings, all users)
+# =====================================================
+#
+# Push delivery pops due events from one heap instead of polling every user.
+#
+# Bulk computation:
+#   - Transit motion is shared: positions_at(jd) is sampled once per step
+#     (default hourly) for all bodies and all users.
+#   - Every user contributes targets natal_lon + aspect offset (conj, opp,
+#     ±square, ±trine, ±sextile) for each natal point. Targets do not depend
+#     on the transit body, so all users' targets sit in one sorted array.
+#   - Per step and body, the swept arc [lon(t0), lon(t1)] is located in that
+#     array with two bisections; each target inside is an exact hit whose time
+#     is interpolated linearly within the step. Cost per step is
+#     O(bodies · log targets + hits), independent of idle users.
+#
+# Incremental:
+#   - advance(now) extends the horizon (default 24h) step by step; nothing is
+#     recomputed for steps already swept.
+#   - New users are swept over the cached samples from the previous tick on
+#     (events since that tick come out of the next pop as due) and kept in a
+#     small side index; side indexes are merged into the main one
+#     once they grow (LSM-style), so adds never re-sort the full array.
+#   - Removed users are dropped lazily: their heap entries are skipped on pop
+#     and their targets are discarded at the next merge.
+#
+# Kinds:
+#   - "angle_crossing": transit body conjunct a natal angle (Asc/MC/Desc/IC),
+#     the event solve_angle_crossing() solves for one (body, angle, window).
+#   - "exact_aspect": every other (body, natal point, aspect) exactitude.
+# Transiting angles are per-location and are not scheduled here.
+#
+# Accuracy: linear interpolation inside one step. Hourly steps put the Moon
+# within seconds of the exact time; near a station the time error grows
+# (speed → 0) but stays inside the step.
+
+SCHEDULER_VERSION = "0.1.0-scaffold"
+
+DEFAULT_STEP_MINUTES = 60
+DEFAULT_HORIZON_HOURS = 24
+
+_UNIX_EPOCH_JD = 2440587.5
+
+# (aspect, signed offset from the natal point); conj/opp have one target.
+TARGET_OFFSETS: Tuple[Tuple[str, float], ...] = tuple(
+    (asp, sign * float(deg))
+    for asp, deg in ASPECTS.items()
+    for sign in ((1,) if float(deg) in (0.0, 180.0) else (1, -1))
+)
+
+# Target code layout: slot << 16 | point code << 8 | offset code.
+_SLOT_SHIFT = 16
+_POINT_SHIFT = 8
+_BYTE = 0xFF
+
+TimeLike = Union[float, datetime]
+PositionsAt = Callable[[float], Mapping[str, float]]
+
+
+@dataclass(frozen=True)
+class ScheduledEvent:
+    user_id: str
+    kind: str               # exact_aspect | angle_crossing
+    t_body: str
+    n_point: str
+    aspect: str
+    exact_deg: float
+    hardness: str
+    direction: str          # forward | retrograde
+    jd_ut: float
+    at_utc_iso: str
+    lon_at_exact: float
+
+# =====================================================
+# Time Helpers
+# =====================================================
+
+def to_jd(t: TimeLike) -> float:
+    """JD UT from a JD float or a datetime (naive datetimes are taken as UTC)."""
+    if isinstance(t, datetime):
+        if t.tzinfo is None:
+            t = t.replace(tzinfo=timezone.utc)
+        return t.timestamp() / 86400.0 + _UNIX_EPOCH_JD
+    return float(t)
+
+
+def jd_to_utc(jd: float) -> datetime:
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(days=jd - _UNIX_EPOCH_JD)
+
+
+def frame_positions_at(bodies: Optional[Sequence[str]] = None) -> PositionsAt:
+    """
+    positions_at(jd) backed by compute_transits_frame. Body longitudes are
+    geocentric, so the frame is computed at a fixed UTC location.
+    """
+    names = tuple(bodies) if bodies is not None else tuple(PLANETS)
+
+    def positions_at(jd: float) -> Dict[str, float]:
+        frame = compute_transits_frame(
+            dt_local=jd_to_utc(jd).replace(tzinfo=None),
+            tz_name="UTC",
+            lat=0.0,
+            lon=0.0,
+            include_sidereal=False,
+        )
+        return {b: float(frame.tropical[b]["lon"]) for b in names}
+
+    return positions_at
+
+# =====================================================
+# Sorted Target Index
+# =====================================================
+
+class _TargetIndex:
+    """Target longitudes (sorted) with parallel target codes."""
+
+    __slots__ = ("lons", "codes")
+
+    def __init__(self, lons: Sequence[float], codes: Sequence[int]) -> None:
+        # Argsort instead of sorting (lon, code) tuples; concatenated sorted
+        # runs (a merge) are close to linear for timsort.
+        order = sorted(range(len(lons)), key=lons.__getitem__)
+        self.lons = array("d", [lons[i] for i in order])
+        self.codes = array("Q", [codes[i] for i in order])
+
+    def __len__(self) -> int:
+        return len(self.lons)
+
+    def arc(self, a: float, delta: float) -> Iterator[int]:
+        """
+        Indices of targets swept moving delta degrees from a: (a, a+delta]
+        forward, [a+delta, a) retrograde. Half-open, so a target on a step
+        boundary is hit exactly once.
+        """
+        lons = self.lons
+        if delta > 0:
+            b = a + delta
+            if b < 360.0:
+                yield from range(bisect_right(lons, a), bisect_right(lons, b))
+            else:
+                yield from range(bisect_right(lons, a), len(lons))
+                yield from range(0, bisect_right(lons, b - 360.0))
+        else:
+            b = a + delta
+            if b >= 0.0:
+                yield from range(bisect_left(lons, b), bisect_left(lons, a))
+            else:
+                yield from range(bisect_left(lons, b + 360.0), len(lons))
+                yield from range(0, bisect_left(lons, a))
+
+# =====================================================
+# Scheduler
+# =====================================================
+
+class NotificationScheduler:
+    """
+    Global priority queue of upcoming exact events for all registered users.
+
+        sched = NotificationScheduler(positions_at)
+        for p in profiles:
+            sched.add_profile(p)
+        ...
+        for ev in sched.pop_due(datetime.now(timezone.utc)):
+            push(ev)
+    """
+
+    def __init__(
+        self,
+        positions_at: PositionsAt,
+        *,
+        bodies: Optional[Sequence[str]] = None,
+        step_minutes: int = DEFAULT_STEP_MINUTES,
+        horizon_hours: float = DEFAULT_HORIZON_HOURS,
+        merge_ratio: float = 0.25,
+    ) -> None:
+        if step_minutes <= 0 or horizon_hours <= 0:
+            raise ValueError("step_minutes and horizon_hours must be positive")
+        self.positions_at = positions_at
+        self.bodies: Tuple[str, ...] = tuple(bodies) if bodies is not None else tuple(PLANETS)
+        self.step_days = step_minutes / 1440.0
+        self.horizon_days = horizon_hours / 24.0
+        self.merge_ratio = merge_ratio
+
+        self._heap: List[Tuple[float, int, int, str, int, int, float, bool]] = []
+        self._seq = 0
+
+        self._slots: Dict[int, str] = {}            # live slot -> user_id
+        self._slot_targets: Dict[int, int] = {}
+        self._user_slot: Dict[str, int] = {}
+        self._next_slot = 0
+        self._point_names: List[str] = []
+        self._point_codes: Dict[str, int] = {}
+
+        self._indexes: List[_TargetIndex] = []      # [main, side, side, ...]
+        self._pending_lons: List[float] = []
+        self._pending_codes: List[int] = []
+        self._dead_targets = 0                      # indexed targets of removed users
+        self._pending_slots: Set[int] = set()       # slots whose targets are not indexed yet
+
+        self._samples: List[Tuple[float, Mapping[str, float]]] = []
+        self._now: Optional[float] = None
+
+    # ---- users ----
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def user_count(self) -> int:
+        return len(self._user_slot)
+
+    def add_user(self, user_id: str, natal_lons: Mapping[str, Any]) -> None:
+        """Register (or replace) a user's natal vector: point -> tropical lon."""
+        if user_id in self._user_slot:
+            self.remove_user(user_id)
+        slot = self._next_slot
+        self._next_slot += 1
+        self._slots[slot] = user_id
+        self._user_slot[user_id] = slot
+
+        base = slot << _SLOT_SHIFT
+        lons, codes = self._pending_lons, self._pending_codes
+        n = 0
+        for point, lon in natal_lons.items():
+            if not isinstance(lon, (int, float)):
+                continue
+            pcode = base | (self._point_code(point) << _POINT_SHIFT)
+            for tcode, (_, offset) in enumerate(TARGET_OFFSETS):
+                lons.append(normalize_deg(float(lon) + offset))
+                codes.append(pcode | tcode)
+            n += len(TARGET_OFFSETS)
+        self._slot_targets[slot] = n
+        self._pending_slots.add(slot)
+
+    def add_profile(self, profile: Dict[str, Any]) -> None:
+        self.add_user(profile["profile_id"], natal_points_from_profile(profile))
+
+    def remove_user(self, user_id: str) -> bool:
+        slot = self._user_slot.pop(user_id, None)
+        if slot is None:
+            return False
+        del self._slots[slot]
+        n = self._slot_targets.pop(slot)
+        if slot in self._pending_slots:
+            self._pending_slots.discard(slot)   # _flush_pending drops its targets
+        else:
+            # Its targets stay in the indexes until the next merge drops them.
+            self._dead_targets += n
+        return True
+
+    def _point_code(self, point: str) -> int:
+        code = self._point_codes.get(point)
+        if code is None:
+            if len(self._point_names) > _BYTE:
+                raise ValueError("NotificationScheduler supports at most 256 distinct natal points")
+            code = self._point_codes[point] = len(self._point_names)
+            self._point_names.append(point)
+        return code
+
+    # ---- time ----
+
+    def advance(self, now: TimeLike) -> int:
+        """
+        Move the clock to `now` and extend the horizon to now + horizon.
+        Returns the number of events scheduled by this call.
+        """
+        jd_now = to_jd(now)
+        pushed = 0
+        with span("notification_sweep"):
+            # Late adds are swept from the previous tick, so events between that
+            # tick and this one are still delivered (as due) rather than skipped.
+            pushed += self._flush_pending()
+            if self._now is None or jd_now > self._now:
+                self._now = jd_now
+
+            if not self._samples:
+                jd0 = floor(self._now / self.step_days) * self.step_days
+                self._samples.append((jd0, self._sample(jd0)))
+
+            end = self._now + self.horizon_days
+            while self._samples[-1][0] < end:
+                jd0, pos0 = self._samples[-1]
+                jd1 = jd0 + self.step_days
+                pos1 = self._sample(jd1)
+                self._samples.append((jd1, pos1))
+                pushed += self._sweep(jd0, pos0, jd1, pos1, self._indexes, self._now)
+
+            # Keep the step containing now onward; late adds are swept over it.
+            drop = 0
+            while drop + 1 < len(self._samples) and self._samples[drop + 1][0] <= self._now:
+                drop += 1
+            del self._samples[:drop]
+
+            self._maybe_merge()
+        count("notifications.scheduled", pushed)
+        return pushed
+
+    def pop_due(self, now: TimeLike, limit: Optional[int] = None) -> List[ScheduledEvent]:
+        """Advance to `now` and pop every live event with jd_ut <= now, in time order."""
+        self.advance(now)
+        jd_now = to_jd(now)
+        out: List[ScheduledEvent] = []
+        heap = self._heap
+        while heap and heap[0][0] <= jd_now and (limit is None or len(out) < limit):
+            item = heapq.heappop(heap)
+            if item[2] in self._slots:
+                out.append(self._event(item))
+        return out
+
+    def peek(self) -> Optional[ScheduledEvent]:
+        """Earliest scheduled live event (within the current horizon), without popping."""
+        heap = self._heap
+        while heap and heap[0][2] not in self._slots:
+            heapq.heappop(heap)
+        return self._event(heap[0]) if heap else None
+
+    def next_by_user(self) -> Dict[str, ScheduledEvent]:
+        """Earliest scheduled event per user within the current horizon (one heap pass)."""
+        best: Dict[int, Tuple[float, int, int, str, int, int, float, bool]] = {}
+        for item in self._heap:
+            slot = item[2]
+            if slot in self._slots and (slot not in best or item < best[slot]):
+                best[slot] = item
+        return {self._slots[slot]: self._event(item) for slot, item in best.items()}
+
+    # ---- internals ----
+
+    def _sample(self, jd: float) -> Mapping[str, float]:
+        count("ephemeris.frames")
+        return self.positions_at(jd)
+
+    def _sweep(
+        self,
+        jd0: float,
+        pos0: Mapping[str, float],
+        jd1: float,
+        pos1: Mapping[str, float],
+        indexes: Sequence[_TargetIndex],
+        not_before: float,
+    ) -> int:
+        heap, slots = self._heap, self._slots
+        dt = jd1 - jd0
+        pushed = 0
+        for body in self.bodies:
+            a = normalize_deg(pos0[body])
+            delta = ang_diff_signed(pos1[body], a)
+            if delta == 0.0:
+                continue
+            retro = delta < 0
+            for ix in indexes:
+                lons, codes = ix.lons, ix.codes
+                for i in ix.arc(a, delta):
+                    code = codes[i]
+                    slot = code >> _SLOT_SHIFT
+                    if slot not in slots:
+                        continue
+                    t_lon = lons[i]
+                    off = -((a - t_lon) % 360.0) if retro else (t_lon - a) % 360.0
+                    jd = jd0 + off / delta * dt
+                    if jd <= not_before:
+                        continue
+                    self._seq += 1
+                    heapq.heappush(
+                        heap,
+                        (jd, self._seq, slot, body, (code >> _POINT_SHIFT) & _BYTE, code & _BYTE, t_lon, retro),
+                    )
+                    pushed += 1
+        return pushed
+
+    def _flush_pending(self) -> int:
+        lons, codes = self._pending_lons, self._pending_codes
+        if not lons:
+            return 0
+        self._pending_lons, self._pending_codes = [], []
+        self._pending_slots.clear()
+        lons, codes = self._live_only(lons, codes)
+        if not lons:
+            return 0
+        side = _TargetIndex(lons, codes)
+        pushed = 0
+        if self._now is not None:
+            samples = self._samples
+            for (jd0, pos0), (jd1, pos1) in zip(samples, samples[1:]):
+                pushed += self._sweep(jd0, pos0, jd1, pos1, (side,), self._now)
+        self._indexes.append(side)
+        return pushed
+
+    def _live_only(self, lons: List[float], codes: List[int]) -> Tuple[List[float], List[int]]:
+        slots = self._slots
+        keep = [i for i, c in enumerate(codes) if c >> _SLOT_SHIFT in slots]
+        if len(keep) == len(codes):
+            return lons, codes
+        return [lons[i] for i in keep], [codes[i] for i in keep]
+
+    def _maybe_merge(self) -> None:
+        indexes = self._indexes
+        if not indexes or (len(indexes) < 2 and not self._dead_targets):
+            return
+        total = sum(len(ix) for ix in indexes)
+        side = total - len(indexes[0])
+        if side <= self.merge_ratio * len(indexes[0]) and self._dead_targets <= self.merge_ratio * total:
+            return
+        lons: List[float] = []
+        codes: List[int] = []
+        for ix in indexes:
+            lons.extend(ix.lons)
+            codes.extend(ix.codes)
+        if self._dead_targets:
+            lons, codes = self._live_only(lons, codes)
+        self._indexes = [_TargetIndex(lons, codes)]
+        self._dead_targets = 0
+
+    def _event(self, item: Tuple[float, int, int, str, int, int, float, bool]) -> ScheduledEvent:
+        jd, _, slot, body, pcode, tcode, t_lon, retro = item
+        point = self._point_names[pcode]
+        aspect, offset = TARGET_OFFSETS[tcode]
+        return ScheduledEvent(
+            user_id=self._slots[slot],
+            kind="angle_crossing" if aspect == "conj" and point in ANGLE_KEYS else "exact_aspect",
+            t_body=body,
+            n_point=point,
+            aspect=aspect,
+            exact_deg=abs(offset),
+            hardness=aspect_hardness(aspect),
+            direction="retrograde" if retro else "forward",
+            jd_ut=jd,
+            at_utc_iso=jd_to_utc(jd).isoformat().replace("+00:00", "Z"),
+            lon_at_exact=round(t_lon, 6),
+        )
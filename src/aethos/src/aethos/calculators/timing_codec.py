@@ -0,0 +1,535 @@
+# timing_codec.py
+from __future__ import annotations
+
+import json
+import struct
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .transits_engine import ASPECTS
+from .timing_events import ANGLE_KEYS, aspect_hardness
+
+# =====================================================
+# Compact Binary Encoding for daily_activations payloads
+# =====================================================
+#
+# A timing bundle (the dict returned by build_daily_timing_events) is stored
+# as one frame. Frames are either:
+#   - keyframes: every aspect written in full (6 bytes each), or
+#   - delta frames: aspects that also existed in the previous day's bundle
+#     are written as (index into previous day, tier, houses if changed,
+#     orb delta), usually 3 bytes; new aspects fall back to the full record.
+#
+# Derived fields are never stored: exact_deg comes from ASPECTS, hardness
+# from aspect_hardness() and angle_hit from ANGLE_KEYS. Orbs are quantized
+# to 1e-4 deg, which is lossless for find_transit_aspects (it rounds to 4
+# decimals already).
+#
+# Frame layout (version 1, big-endian):
+#   magic "AT" | version u8 | flags u8 | date ordinal u32
+#   [profile_id: varint len + utf-8]      (FLAG_PROFILE_ID; compact JSON
+#                                          with FLAG_PROFILE_ID_JSON)
+#   [meta: varint len + compact JSON]     (FLAG_META)
+#   aspect count varint | aspect records
+#
+# A delta frame without FLAG_META inherits the previous bundle's meta unless
+# FLAG_NO_META says the bundle has none.
+#
+# Series layout (version 2):
+#   magic "ATS" | version u8 | frame count varint
+#   keyframe count varint | keyframe table: (date ordinal varint,
+#                                            offset into frames varint)*
+#   frames: (varint len + frame)*
+# Version 1 series have no keyframe table; they still decode, and range
+# reads scan them from the first frame.
+#
+# Bump CODEC_VERSION / SERIES_VERSION (and keep the old decoder) for any
+# layout change.
+
+CODEC_VERSION = 1
+SERIES_VERSION = 2
+
+FRAME_MAGIC = b"AT"
+SERIES_MAGIC = b"ATS"
+
+FLAG_DELTA = 0x01
+FLAG_PROFILE_ID = 0x02
+FLAG_META = 0x04
+FLAG_NO_META = 0x08
+FLAG_PROFILE_ID_JSON = 0x10
+_KNOWN_FLAGS = FLAG_DELTA | FLAG_PROFILE_ID | FLAG_META | FLAG_NO_META | FLAG_PROFILE_ID_JSON
+
+ORB_SCALE = 10_000
+ORB_MAX_Q = 0xFFFF
+
+# Enum tables: append only. Reordering breaks every stored payload.
+BODY_CODES: Tuple[str, ...] = (
+    "Sun", "Moon", "Mercury", "Venus", "Mars",
+    "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto",
+    "Earth", "North Node", "South Node", "True Node", "Mean Node",
+    "Chiron", "Lilith",
+    "Asc", "MC", "Desc", "IC",
+)
+ASPECT_CODES: Tuple[str, ...] = ("conj", "opp", "square", "trine", "sextile")
+TIER_CODES: Tuple[str, ...] = ("Exact", "High", "Medium", "Low", "Background")
+
+_BODY_INDEX: Dict[str, int] = {name: i for i, name in enumerate(BODY_CODES)}
+_ASPECT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(ASPECT_CODES)}
+_TIER_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TIER_CODES)}
+
+_HEADER = struct.Struct(">2sBBI")
+_FULL_RECORD = struct.Struct(">BBBBH")
+
+_DELTA_NEW = 0xFF          # tag: full record follows
+_DELTA_MAX_REF = 0xFE      # highest previous-day index a delta record can reference
+_DELTA_HOUSES = 0x08       # delta flags bit: houses byte follows
+
+
+# =====================================================
+# Varint Helpers
+# =====================================================
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    shift = 0
+    n = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def _unzigzag(n: int) -> int:
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+
+
+def _write_blob(out: bytearray, data: bytes) -> None:
+    _write_varint(out, len(data))
+    out += data
+
+
+def _read_blob(buf: bytes, pos: int) -> Tuple[bytes, int]:
+    n, pos = _read_varint(buf, pos)
+    return bytes(buf[pos:pos + n]), pos + n
+
+
+# =====================================================
+# Record Packing
+# =====================================================
+
+def _code(table: Dict[str, int], value: str, what: str) -> int:
+    try:
+        return table[value]
+    except KeyError:
+        raise ValueError(f"timing_codec: unknown {what} {value!r}; extend the enum table") from None
+
+
+def _quantize_orb(orb: float) -> int:
+    q = int(round(float(orb) * ORB_SCALE))
+    if not 0 <= q <= ORB_MAX_Q:
+        raise ValueError(f"timing_codec: orb {orb!r} outside encodable range 0..{ORB_MAX_Q / ORB_SCALE}")
+    return q
+
+
+def _pack_houses(a: Dict[str, Any]) -> int:
+    t_house = int(a["t_house"])
+    n_house = int(a["n_house"])
+    if not (0 <= t_house <= 15 and 0 <= n_house <= 15):
+        raise ValueError(f"timing_codec: house out of range ({t_house}, {n_house})")
+    return (t_house << 4) | n_house
+
+
+def _pack_aspect(a: Dict[str, Any]) -> Tuple[Tuple[str, str, str], int, int, int, int, int]:
+    """Return (key, body, point, aspect<<3|tier, houses, orb_q) for one aspect dict."""
+    body = _code(_BODY_INDEX, a["t_body"], "body")
+    point = _code(_BODY_INDEX, a["n_point"], "natal point")
+    asp = _code(_ASPECT_INDEX, a["aspect"], "aspect")
+    tier = _code(_TIER_INDEX, a["tier"], "tier")
+    key = (a["t_body"], a["n_point"], a["aspect"])
+    return key, body, point, (asp << 3) | tier, _pack_houses(a), _quantize_orb(a["orb"])
+
+
+_TEMPLATES: Dict[Tuple[int, int, int, int], Dict[str, Any]] = {}
+
+
+def _expand_aspect(body: int, point: int, asp_tier: int, houses: int, orb_q: int) -> Dict[str, Any]:
+    """Rebuild the AspectHit.__dict__ shape from packed codes."""
+    key = (body, point, asp_tier, houses)
+    template = _TEMPLATES.get(key)
+    if template is None:
+        aspect = ASPECT_CODES[asp_tier >> 3]
+        n_point = BODY_CODES[point]
+        template = _TEMPLATES[key] = {
+            "t_body": BODY_CODES[body],
+            "n_point": n_point,
+            "aspect": aspect,
+            "orb": 0.0,
+            "exact_deg": float(ASPECTS[aspect]),
+            "tier": TIER_CODES[asp_tier & 0x07],
+            "hardness": aspect_hardness(aspect),
+            "angle_hit": n_point in ANGLE_KEYS,
+            "t_house": houses >> 4,
+            "n_house": houses & 0x0F,
+        }
+    out = template.copy()
+    out["orb"] = orb_q / ORB_SCALE
+    return out
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+# =====================================================
+# Single Frame (one daily_activations row)
+# =====================================================
+
+def encode_timing_bundle(
+    bundle: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """
+    Encode one timing bundle into a compact binary frame.
+
+    - previous: the previous day's bundle for the same profile. When given, the
+      frame is delta-encoded against it (and meta is omitted if unchanged);
+      the decoder then needs the same previous bundle.
+    """
+    flags = 0
+    prev_index: Dict[Tuple[str, str, str], Tuple[int, int, int, int]] = {}
+    if previous is not None:
+        flags |= FLAG_DELTA
+        for i, pa in enumerate(previous.get("aspects", ())):
+            if i > _DELTA_MAX_REF:
+                break
+            key, _, _, asp_tier, houses, orb_q = _pack_aspect(pa)
+            prev_index[key] = (i, asp_tier, houses, orb_q)
+
+    profile_id = bundle.get("profile_id")
+    if "profile_id" in bundle:
+        flags |= FLAG_PROFILE_ID
+        if type(profile_id) is not str:
+            flags |= FLAG_PROFILE_ID_JSON
+
+    meta = bundle.get("meta")
+    if "meta" in bundle:
+        if previous is None or "meta" not in previous or previous["meta"] != meta:
+            flags |= FLAG_META
+    elif previous is not None and "meta" in previous:
+        flags |= FLAG_NO_META
+
+    out = bytearray(_HEADER.pack(
+        FRAME_MAGIC, CODEC_VERSION, flags, date.fromisoformat(bundle["date_local"]).toordinal()
+    ))
+    if flags & FLAG_PROFILE_ID_JSON:
+        _write_blob(out, _json_bytes(profile_id))
+    elif flags & FLAG_PROFILE_ID:
+        _write_blob(out, profile_id.encode("utf-8"))
+    if flags & FLAG_META:
+        _write_blob(out, _json_bytes(meta))
+
+    aspects = bundle.get("aspects", ())
+    _write_varint(out, len(aspects))
+    for a in aspects:
+        key, body, point, asp_tier, houses, orb_q = _pack_aspect(a)
+        ref = prev_index.get(key)
+        if ref is None:
+            if flags & FLAG_DELTA:
+                out.append(_DELTA_NEW)
+            out += _FULL_RECORD.pack(body, point, asp_tier, houses, orb_q)
+            continue
+
+        i, _, prev_houses, prev_orb_q = ref
+        dflags = asp_tier & 0x07
+        if houses != prev_houses:
+            dflags |= _DELTA_HOUSES
+        out.append(i)
+        out.append(dflags)
+        if dflags & _DELTA_HOUSES:
+            out.append(houses)
+        _write_varint(out, _zigzag(orb_q - prev_orb_q))
+
+    return bytes(out)
+
+
+def decode_timing_bundle(
+    blob: bytes,
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Decode a frame back into the timing bundle JSON shape.
+
+    Delta frames require the previous day's decoded bundle.
+    """
+    prev_packed = _packed_aspects(previous) if previous is not None else None
+    return _decode_frame(blob, previous, prev_packed)[0]
+
+
+_Packed = Tuple[int, int, int, int, int]
+
+
+def _packed_aspects(bundle: Dict[str, Any]) -> List[_Packed]:
+    return [_pack_aspect(a)[1:] for a in bundle.get("aspects", ())[:_DELTA_MAX_REF + 1]]
+
+
+def _decode_frame(
+    blob: bytes,
+    previous: Optional[Dict[str, Any]],
+    prev_packed: Optional[List[_Packed]],
+) -> Tuple[Dict[str, Any], List[_Packed]]:
+    """Decode one frame; also return its packed records so the next delta frame can reuse them."""
+    magic, version, flags, ordinal = _HEADER.unpack_from(blob, 0)
+    if magic != FRAME_MAGIC:
+        raise ValueError("timing_codec: not a timing frame")
+    if version != CODEC_VERSION:
+        raise ValueError(f"timing_codec: unsupported codec version {version}")
+    if flags & ~_KNOWN_FLAGS:
+        raise ValueError(f"timing_codec: unknown frame flags {flags:#04x}")
+    pos = _HEADER.size
+
+    delta = bool(flags & FLAG_DELTA)
+    if delta and (previous is None or prev_packed is None):
+        raise ValueError("timing_codec: delta frame requires the previous bundle")
+
+    profile_id = None
+    if flags & FLAG_PROFILE_ID:
+        raw, pos = _read_blob(blob, pos)
+        profile_id = json.loads(raw) if flags & FLAG_PROFILE_ID_JSON else raw.decode("utf-8")
+
+    has_meta = True
+    if flags & FLAG_META:
+        raw, pos = _read_blob(blob, pos)
+        meta = json.loads(raw)
+    elif flags & FLAG_NO_META:
+        has_meta = False
+        meta = None
+    elif delta and "meta" in previous:
+        meta = previous["meta"]
+    else:
+        has_meta = False
+        meta = None
+
+    count, pos = _read_varint(blob, pos)
+    packed: List[_Packed] = []
+    unpack_full = _FULL_RECORD.unpack_from
+    full_size = _FULL_RECORD.size
+
+    for _ in range(count):
+        if delta:
+            tag = blob[pos]
+            pos += 1
+            if tag != _DELTA_NEW:
+                body, point, asp_tier, houses, orb_q = prev_packed[tag]
+                dflags = blob[pos]
+                pos += 1
+                if dflags & _DELTA_HOUSES:
+                    houses = blob[pos]
+                    pos += 1
+                zz, pos = _read_varint(blob, pos)
+                packed.append((
+                    body, point, (asp_tier & ~0x07) | (dflags & 0x07), houses, orb_q + _unzigzag(zz)
+                ))
+                continue
+        packed.append(unpack_full(blob, pos))
+        pos += full_size
+
+    bundle: Dict[str, Any] = {}
+    if flags & FLAG_PROFILE_ID:
+        bundle["profile_id"] = profile_id
+    bundle["date_local"] = date.fromordinal(ordinal).isoformat()
+    bundle["aspects"] = [_expand_aspect(*rec) for rec in packed]
+    if has_meta:
+        bundle["meta"] = meta
+    return bundle, packed[:_DELTA_MAX_REF + 1]
+
+
+# =====================================================
+# Series (range storage / year-long reads)
+# =====================================================
+
+def encode_timing_series(
+    bundles: Iterable[Dict[str, Any]],
+    keyframe_interval: int = 32,
+) -> bytes:
+    """
+    Encode consecutive bundles of one profile (one per day, ordered by
+    date_local) into one blob.
+
+    The first frame and every `keyframe_interval`-th frame after it are
+    keyframes. Their dates and offsets go into the series header, so
+    decode_timing_series_range starts at the nearest one, and a corrupt frame
+    only affects its own run.
+    """
+    frames = bytearray()
+    keyframes: List[Tuple[int, int]] = []
+    n = 0
+    last_ordinal = -1
+    previous: Optional[Dict[str, Any]] = None
+    for bundle in bundles:
+        ordinal = date.fromisoformat(bundle["date_local"]).toordinal()
+        if ordinal <= last_ordinal:
+            raise ValueError("timing_codec: series bundles must have strictly increasing date_local")
+        last_ordinal = ordinal
+        if n == 0 or (keyframe_interval > 0 and n % keyframe_interval == 0):
+            previous = None
+            keyframes.append((ordinal, len(frames)))
+        _write_blob(frames, encode_timing_bundle(bundle, previous))
+        previous = bundle
+        n += 1
+
+    out = bytearray(SERIES_MAGIC)
+    out.append(SERIES_VERSION)
+    _write_varint(out, n)
+    _write_varint(out, len(keyframes))
+    for ordinal, offset in keyframes:
+        _write_varint(out, ordinal)
+        _write_varint(out, offset)
+    out += frames
+    return bytes(out)
+
+
+def _series_header(blob: bytes) -> Tuple[int, List[Tuple[int, int]], int]:
+    """Return (frame count, keyframe table, position of the first frame)."""
+    if blob[:3] != SERIES_MAGIC:
+        raise ValueError("timing_codec: not a timing series")
+    version = blob[3]
+    if version not in (1, SERIES_VERSION):
+        raise ValueError(f"timing_codec: unsupported series version {version}")
+    count, pos = _read_varint(blob, 4)
+    keyframes: List[Tuple[int, int]] = []
+    if version >= 2:
+        k, pos = _read_varint(blob, pos)
+        for _ in range(k):
+            ordinal, pos = _read_varint(blob, pos)
+            offset, pos = _read_varint(blob, pos)
+            keyframes.append((ordinal, offset))
+    return count, keyframes, pos
+
+
+def iter_decode_timing_series(blob: bytes) -> Iterator[Dict[str, Any]]:
+    """Stream bundles out of a series blob without materializing the full list."""
+    count, _, pos = _series_header(blob)
+    previous: Optional[Dict[str, Any]] = None
+    prev_packed: Optional[List[_Packed]] = None
+    for _ in range(count):
+        n, pos = _read_varint(blob, pos)
+        frame = blob[pos:pos + n]
+        pos += n
+        # Keyframes ignore `previous`; delta frames reuse its packed records.
+        previous, prev_packed = _decode_frame(frame, previous, prev_packed)
+        yield previous
+
+
+def decode_timing_series(blob: bytes) -> List[Dict[str, Any]]:
+    return list(iter_decode_timing_series(blob))
+
+
+def decode_timing_series_range(blob: bytes, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    """
+    Decode only the bundles with start_date <= date_local <= end_date.
+
+    Decoding starts at the last keyframe dated on or before start_date, so at
+    most keyframe_interval - 1 frames before the range are decoded and
+    dropped. Decoding stops at the first frame after end_date.
+    """
+    _, keyframes, pos = _series_header(blob)
+    lo, hi = start_date.toordinal(), end_date.toordinal()
+    k = bisect_right([ordinal for ordinal, _ in keyframes], lo) - 1
+    if k >= 0:
+        pos += keyframes[k][1]
+
+    out: List[Dict[str, Any]] = []
+    previous: Optional[Dict[str, Any]] = None
+    prev_packed: Optional[List[_Packed]] = None
+    end = len(blob)
+    while pos < end:
+        n, pos = _read_varint(blob, pos)
+        frame = blob[pos:pos + n]
+        pos += n
+        ordinal = _HEADER.unpack_from(frame, 0)[3]
+        if ordinal > hi:
+            break
+        previous, prev_packed = _decode_frame(frame, previous, prev_packed)
+        if ordinal >= lo:
+            out.append(previous)
+    return out
+
+
+# =====================================================
+# Synthetic Bundles
+# =====================================================
+#
+# Fixtures for `python -m benchmarks.run --only
+# timing_codec_encode_year,timing_codec_decode_year,timing_codec_decode_range`.
+
+def _synthetic_year(profile_id: str = "bench-profile", days: int = 365) -> List[Dict[str, Any]]:
+    """Deterministic slow-drifting bundles that mimic a real year of activations."""
+    from datetime import timedelta
+    from .timing_events import ORBS_ANGLES, ORBS_DEFAULT, orb_tier
+
+    slow = ("Jupiter", "Saturn", "Uranus", "Neptune", "Pluto", "Mars")
+    natal = ("Sun", "Moon", "Mercury", "Venus", "Asc", "MC")
+    start = date(2026, 1, 1)
+    out: List[Dict[str, Any]] = []
+    for d in range(days):
+        aspects = []
+        for i, body in enumerate(slow):
+            for j, point in enumerate(natal):
+                phase = (d * (i + 1) * 0.013 + j * 0.7 + i * 0.31) % 4.0
+                if phase > 3.0:
+                    continue
+                orb = round(abs(phase - 1.5), 4)
+                angle_hit = point in ANGLE_KEYS
+                aspect = ASPECT_CODES[(i + j) % len(ASPECT_CODES)]
+                aspects.append({
+                    "t_body": body, "n_point": point, "aspect": aspect, "orb": orb,
+                    "exact_deg": float(ASPECTS[aspect]), "tier": orb_tier(orb, angle_hit),
+                    "hardness": aspect_hardness(aspect), "angle_hit": angle_hit,
+                    "t_house": 1 + (i + d // 30) % 12, "n_house": 1 + j,
+                })
+        aspects.sort(key=lambda h: (h["orb"], 0 if h["angle_hit"] else 1))
+        out.append({
+            "profile_id": profile_id,
+            "date_local": (start + timedelta(days=d)).isoformat(),
+            "aspects": aspects[:32],
+            "meta": {
+                "orb_policy": {"default": ORBS_DEFAULT, "angles": ORBS_ANGLES},
+                "no_guessing_policy": True,
+            },
+        })
+    return out
+
+
+def _edge_case_days(profile_id: str = "bench-profile") -> List[Dict[str, Any]]:
+    """
+    Consecutive bundles whose meta and profile_id change presence and type
+    day to day (dropped meta, meta = None, int / missing / None / non-ASCII
+    profile_id, no aspects): the cases delta frames must not paper over.
+    """
+    days = _synthetic_year(profile_id=profile_id, days=8)
+    del days[1]["meta"]
+    days[3]["profile_id"] = 12345
+    del days[4]["profile_id"]
+    days[4]["meta"] = None
+    days[5]["profile_id"] = None
+    del days[5]["meta"]
+    days[6]["aspects"] = []
+    days[6]["meta"] = {}
+    days[7]["profile_id"] = "profil-\u00e9"
+    del days[7]["meta"]
+    return days
+
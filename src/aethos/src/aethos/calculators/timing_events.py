@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 
+from aethos.calculators.instrumentation import count, instrumented, span, timed
+
 # NOTE: relative import for proper package structure
 from .transits_engine import (
     TransitFrame,
@@ -131,6 +133,7 @@ def profile_geo(profile: Dict[str, Any]) -> Tuple[str, float, float]:
 # Transit → Natal Aspect Detection
 # =====================================================
 
+@timed("aspects")
 def find_transit_aspects(
     natal_lons: Dict[str, float],
     natal_asc_lon: float,
@@ -187,6 +190,7 @@ def _transit_lon_at(
     body: str,
 ) -> Tuple[float, float, float, str, str]:
 
+    count("ephemeris.frames")
     frame = compute_transits_frame(
         dt_local=dt_local,
         tz_name=tz_name,
@@ -205,6 +209,7 @@ def _transit_lon_at(
     )
 
 
+@timed("crossings")
 def solve_angle_crossing(
     body: str,
     natal_angle_name: str,
@@ -232,6 +237,7 @@ def solve_angle_crossing(
     best = None
 
     for _ in range(max_iter):
+        count("crossing.iterations")
         mid = a + (b - a) / 2
         jd, mlon, mspd, utc_iso, loc_iso = _transit_lon_at(mid, tz_name, lat, lon, body)
         fm = ang_diff_signed(mlon, natal_angle_lon)
@@ -279,8 +285,23 @@ def build_daily_timing_events(
     angle_step_minutes: int = 30,
     ingress_step_minutes: int = 30,
     max_aspects: int = 32,
+    include_instrumentation: bool = False,
 ) -> Dict[str, Any]:
 
+    if include_instrumentation:
+        # Scope a recorder to this build; totals also fold into any outer recorder.
+        with instrumented() as rec:
+            bundle = build_daily_timing_events(
+                profile_path,
+                day_local,
+                aspects_at_time_local=aspects_at_time_local,
+                angle_step_minutes=angle_step_minutes,
+                ingress_step_minutes=ingress_step_minutes,
+                max_aspects=max_aspects,
+            )
+        bundle["meta"]["instrumentation"] = rec.snapshot()
+        return bundle
+
     profile = load_profile(profile_path)
     tz_name, lat, lon = profile_geo(profile)
 
@@ -291,14 +312,16 @@ def build_daily_timing_events(
     if aspects_at_time_local is None:
         aspects_at_time_local = day_local.replace(hour=9, minute=0, second=0)
 
-    frame = compute_transits_frame(
-        dt_local=aspects_at_time_local,
-        tz_name=tz_name,
-        lat=lat,
-        lon=lon,
-        include_sidereal=False,
-        angles_house_system=b"P",
-    )
+    with span("transit_frame"):
+        count("ephemeris.frames")
+        frame = compute_transits_frame(
+            dt_local=aspects_at_time_local,
+            tz_name=tz_name,
+            lat=lat,
+            lon=lon,
+            include_sidereal=False,
+            angles_house_system=b"P",
+        )
 
     aspects = find_transit_aspects(
         natal_lons=natal_lons,
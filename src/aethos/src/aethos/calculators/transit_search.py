@@ -0,0 +1,423 @@
+# transit_search.py
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from aethos.calculators.instrumentation import count, span
+
+from .transits_engine import ASPECTS, normalize_deg
+from .timing_events import ANGLE_KEYS, ang_diff_signed, aspect_hardness
+from .notification_scheduler import TimeLike, frame_positions_at, jd_to_utc, to_jd
+
+# =====================================================
+# Long-Span Transit Search (coarse-to-fine)
+# =====================================================
+#
+# Finds every exact transit of one body to a set of target longitudes over
+# years, e.g. "Saturn square natal Sun, 30 years" or "Jupiter returns for a
+# cohort", without fixed-step frame scans.
+#
+#   f_T(t) = ang_diff_signed(lon_body(t), T)        (-180, 180]
+#
+# Stepping:
+#   - MAX_SPEED bounds |d lon / dt|. From t, no target can be reached before
+#     t + d / vmax, where d is the distance to the nearest target, so the
+#     step is h = clamp(d / vmax, min_step, max_step). Far from every target
+#     the search skips months at a time.
+#   - For a target T and interval [a, b] a root needs |f(a)| + |f(b)| <=
+#     vmax · (b - a); intervals failing that bound are discarded without
+#     further evaluations.
+#   - Reachable intervals longer than min_step are halved, so a retrograde
+#     double crossing inside one coarse step is still split into brackets.
+#   - |f(b) - f(a)| > 180 is a wrap through the opposite point, not a root
+#     (max_step keeps vmax · h <= 90, so wraps and roots cannot mix).
+#   - Sign changes are refined by bracketed false position (Illinois).
+#
+# Multi-pass events: within one pass over a target the crossing direction
+# alternates (direct, retrograde, direct). Two consecutive crossings in the
+# same direction mean the body wrapped all the way around in between, so a
+# new pass group starts. Hits carry pass_index / pass_count.
+#
+# Batch: search_cohort() puts every user's targets in one sorted array and
+# walks the body once; the step is driven by the nearest target of anyone,
+# and every evaluation of the body is memoized and shared across users.
+
+SEARCH_VERSION = "0.1.0-scaffold"
+
+# Conservative maxima of |geocentric longitude speed|, deg/day.
+MAX_SPEED: Dict[str, float] = {
+    "Moon": 15.5,
+    "Sun": 1.03,
+    "Mercury": 2.25,
+    "Venus": 1.27,
+    "Mars": 0.8,
+    "Jupiter": 0.25,
+    "Saturn": 0.14,
+    "Uranus": 0.07,
+    "Neptune": 0.04,
+    "Pluto": 0.045,
+    "Chiron": 0.16,
+    "Mean Node": 0.06,
+    "True Node": 0.25,
+}
+
+DEFAULT_MIN_STEP_DAYS = 0.5
+DEFAULT_TOL_DAYS = 1e-5         # ~1 s
+DEFAULT_TOL_DEG = 1e-7
+MAX_REFINE_ITER = 60
+
+LonAt = Callable[[str, float], float]
+
+
+@dataclass(frozen=True)
+class TransitHit:
+    key: Optional[str]          # cohort member id (None for single searches)
+    kind: str                   # exact_aspect | angle_crossing
+    t_body: str
+    n_point: str
+    aspect: str
+    exact_deg: float
+    hardness: str
+    direction: str              # forward | retrograde
+    jd_ut: float
+    at_utc_iso: str
+    lon_at_exact: float
+    pass_index: int
+    pass_count: int
+
+# =====================================================
+# Ephemeris Adapters
+# =====================================================
+
+def frame_lon_at(bodies: Optional[Sequence[str]] = None) -> LonAt:
+    """
+    lon_at(body, jd) backed by compute_transits_frame. The last frame is
+    kept, so asking several bodies at the same jd computes one frame.
+    """
+    positions_at = frame_positions_at(bodies)
+    last: List[Any] = [None, None]
+
+    def lon_at(body: str, jd: float) -> float:
+        if last[0] != jd:
+            last[0], last[1] = jd, positions_at(jd)
+        return last[1][body]
+
+    return lon_at
+
+
+class _BodyMotion:
+    """Memoized longitude of one body; shared by every target in a search."""
+
+    __slots__ = ("body", "lon_at", "cache")
+
+    def __init__(self, body: str, lon_at: LonAt) -> None:
+        self.body = body
+        self.lon_at = lon_at
+        self.cache: Dict[float, float] = {}
+
+    def __call__(self, jd: float) -> float:
+        v = self.cache.get(jd)
+        if v is None:
+            v = self.cache[jd] = normalize_deg(float(self.lon_at(self.body, jd)))
+        return v
+
+# =====================================================
+# Targets
+# =====================================================
+
+def _target_offsets(aspects: Optional[Iterable[str]]) -> Tuple[Tuple[str, float], ...]:
+    names = tuple(ASPECTS) if aspects is None else tuple(aspects)
+    out: List[Tuple[str, float]] = []
+    for asp in names:
+        if asp not in ASPECTS:
+            raise ValueError(f"Unknown aspect {asp!r}; expected one of {', '.join(ASPECTS)}")
+        deg = float(ASPECTS[asp])
+        out.append((asp, deg))
+        if deg not in (0.0, 180.0):
+            out.append((asp, -deg))
+    return tuple(out)
+
+
+class _Targets:
+    """Sorted target longitudes with (key, point, aspect, offset) payloads."""
+
+    def __init__(self, rows: List[Tuple[float, Optional[str], str, str, float]]) -> None:
+        rows.sort(key=lambda r: r[0])
+        self.lons: List[float] = [r[0] for r in rows]
+        self.meta: List[Tuple[Optional[str], str, str, float]] = [r[1:] for r in rows]
+
+    def __len__(self) -> int:
+        return len(self.lons)
+
+    def nearest(self, lon: float) -> float:
+        """Circular distance from lon to the closest target."""
+        lons = self.lons
+        i = bisect_left(lons, lon)
+        below = lons[i - 1] if i > 0 else lons[-1] - 360.0
+        above = lons[i] if i < len(lons) else lons[0] + 360.0
+        return min(lon - below, above - lon)
+
+    def within(self, lon: float, radius: float) -> Iterable[int]:
+        """Indices of targets within radius degrees of lon (circular)."""
+        lons = self.lons
+        if radius >= 180.0:
+            return range(len(lons))
+        lo, hi = lon - radius, lon + radius
+        if lo < 0.0:
+            return list(range(bisect_left(lons, lo + 360.0), len(lons))) + list(range(0, bisect_right(lons, hi)))
+        if hi >= 360.0:
+            return list(range(bisect_left(lons, lo), len(lons))) + list(range(0, bisect_right(lons, hi - 360.0)))
+        return range(bisect_left(lons, lo), bisect_right(lons, hi))
+
+
+def _build_targets(
+    natal_by_key: Mapping[Optional[str], Mapping[str, Any]],
+    offsets: Tuple[Tuple[str, float], ...],
+) -> _Targets:
+    rows: List[Tuple[float, Optional[str], str, str, float]] = []
+    for key, natal in natal_by_key.items():
+        for point, lon in natal.items():
+            if not isinstance(lon, (int, float)):
+                continue
+            for asp, off in offsets:
+                rows.append((normalize_deg(float(lon) + off), key, point, asp, off))
+    return _Targets(rows)
+
+# =====================================================
+# Root Finding
+# =====================================================
+
+def _crosses(fa: float, fb: float) -> bool:
+    # Half-open: a root exactly on a shared boundary belongs to one interval.
+    return (fa < 0.0) != (fb < 0.0)
+
+
+def _refine(
+    f: Callable[[float], float],
+    a: float,
+    fa: float,
+    b: float,
+    fb: float,
+    tol_days: float,
+    tol_deg: float,
+) -> float:
+    """Illinois false position on a bracket with f(a), f(b) of opposite sign."""
+    side = 0
+    c = a
+    for _ in range(MAX_REFINE_ITER):
+        c = (a * fb - b * fa) / (fb - fa)
+        if b - a <= tol_days:
+            break
+        fc = f(c)
+        if abs(fc) <= tol_deg:
+            break
+        if (fc < 0.0) == (fb < 0.0):
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2.0
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2.0
+            side = 1
+    return c
+
+
+class _Search:
+    def __init__(
+        self,
+        motion: _BodyMotion,
+        targets: _Targets,
+        vmax: float,
+        min_step: float,
+        max_step: float,
+        tol_days: float,
+        tol_deg: float,
+    ) -> None:
+        self.motion = motion
+        self.targets = targets
+        self.vmax = vmax
+        self.min_step = min_step
+        self.max_step = max_step
+        self.tol_days = tol_days
+        self.tol_deg = tol_deg
+        # target index -> [(jd, forward)]
+        self.roots: Dict[int, List[Tuple[float, bool]]] = {}
+
+    def run(self, t0: float, t1: float) -> None:
+        motion, targets, vmax = self.motion, self.targets, self.vmax
+        t, la = t0, motion(t0)
+        while t < t1:
+            h = min(max(targets.nearest(la) / vmax, self.min_step), self.max_step, t1 - t)
+            b = t + h
+            lb = motion(b)
+            reach = vmax * h
+            for i in targets.within(la, reach):
+                T = targets.lons[i]
+                fa = ang_diff_signed(la, T)
+                fb = ang_diff_signed(lb, T)
+                if abs(fa) + abs(fb) <= reach:
+                    self._scan(i, T, t, fa, b, fb)
+            t, la = b, lb
+
+    def _scan(self, i: int, T: float, a: float, fa: float, b: float, fb: float) -> None:
+        if abs(fb - fa) > 180.0:
+            return  # wrap through T + 180
+        h = b - a
+        if abs(fa) + abs(fb) > self.vmax * h:
+            return  # target unreachable inside [a, b]
+        if h > self.min_step:
+            m = a + h / 2.0
+            fm = ang_diff_signed(self.motion(m), T)
+            self._scan(i, T, a, fa, m, fm)
+            self._scan(i, T, m, fm, b, fb)
+            return
+        if not _crosses(fa, fb):
+            return
+        f = lambda jd: ang_diff_signed(self.motion(jd), T)  # noqa: E731
+        jd = _refine(f, a, fa, b, fb, self.tol_days, self.tol_deg)
+        self.roots.setdefault(i, []).append((jd, fb > fa))
+        count("transit_search.roots")
+
+    def hits(self, body: str) -> List[TransitHit]:
+        out: List[TransitHit] = []
+        for i, roots in self.roots.items():
+            roots.sort()
+            key, point, aspect, offset = self.targets.meta[i]
+            T = self.targets.lons[i]
+            kind = "angle_crossing" if aspect == "conj" and point in ANGLE_KEYS else "exact_aspect"
+            for group in _pass_groups(roots):
+                n = len(group)
+                for k, (jd, forward) in enumerate(group, start=1):
+                    out.append(
+                        TransitHit(
+                            key=key,
+                            kind=kind,
+                            t_body=body,
+                            n_point=point,
+                            aspect=aspect,
+                            exact_deg=abs(offset),
+                            hardness=aspect_hardness(aspect),
+                            direction="forward" if forward else "retrograde",
+                            jd_ut=jd,
+                            at_utc_iso=jd_to_utc(jd).isoformat().replace("+00:00", "Z"),
+                            lon_at_exact=round(T, 6),
+                            pass_index=k,
+                            pass_count=n,
+                        )
+                    )
+        out.sort(key=lambda h: (h.jd_ut, h.key or "", h.n_point, h.aspect))
+        return out
+
+
+def _pass_groups(roots: List[Tuple[float, bool]]) -> List[List[Tuple[float, bool]]]:
+    """Split time-sorted crossings where two consecutive ones share a direction."""
+    groups: List[List[Tuple[float, bool]]] = []
+    for root in roots:
+        if groups and groups[-1][-1][1] != root[1]:
+            groups[-1].append(root)
+        else:
+            groups.append([root])
+    return groups
+
+# =====================================================
+# Public API
+# =====================================================
+
+def _run(
+    lon_at: LonAt,
+    body: str,
+    natal_by_key: Mapping[Optional[str], Mapping[str, Any]],
+    t0: TimeLike,
+    t1: TimeLike,
+    aspects: Optional[Iterable[str]],
+    max_speed: Optional[float],
+    min_step_days: float,
+    max_step_days: Optional[float],
+    tol_days: float,
+    tol_deg: float,
+) -> List[TransitHit]:
+    vmax = max_speed if max_speed is not None else MAX_SPEED.get(body)
+    if vmax is None or vmax <= 0:
+        raise ValueError(f"No max speed for {body!r}; add it to MAX_SPEED or pass max_speed=")
+    jd0, jd1 = to_jd(t0), to_jd(t1)
+    if jd1 <= jd0:
+        raise ValueError("t1 must be after t0")
+
+    targets = _build_targets(natal_by_key, _target_offsets(aspects))
+    if not len(targets):
+        return []
+
+    with span("transit_search"):
+        motion = _BodyMotion(body, lon_at)
+        search = _Search(
+            motion,
+            targets,
+            vmax=vmax,
+            min_step=min_step_days,
+            max_step=max_step_days if max_step_days is not None else 90.0 / vmax,
+            tol_days=tol_days,
+            tol_deg=tol_deg,
+        )
+        search.run(jd0, jd1)
+        count("transit_search.evaluations", len(motion.cache))
+        return search.hits(body)
+
+
+def search_transits(
+    lon_at: LonAt,
+    body: str,
+    natal_lons: Mapping[str, Any],
+    t0: TimeLike,
+    t1: TimeLike,
+    *,
+    aspects: Optional[Iterable[str]] = None,
+    max_speed: Optional[float] = None,
+    min_step_days: float = DEFAULT_MIN_STEP_DAYS,
+    max_step_days: Optional[float] = None,
+    tol_days: float = DEFAULT_TOL_DAYS,
+    tol_deg: float = DEFAULT_TOL_DEG,
+) -> List[TransitHit]:
+    """
+    Every exact `body` transit to `natal_lons` between t0 and t1, in time order.
+
+        search_transits(lon_at, "Saturn", {"Sun": natal["Sun"]}, t0, t0 + 30 * 365.25,
+                        aspects=("square",))
+    """
+    return _run(
+        lon_at, body, {None: natal_lons}, t0, t1,
+        aspects, max_speed, min_step_days, max_step_days, tol_days, tol_deg,
+    )
+
+
+def search_cohort(
+    lon_at: LonAt,
+    body: str,
+    cohort: Mapping[str, Mapping[str, Any]],
+    t0: TimeLike,
+    t1: TimeLike,
+    *,
+    aspects: Optional[Iterable[str]] = None,
+    max_speed: Optional[float] = None,
+    min_step_days: float = DEFAULT_MIN_STEP_DAYS,
+    max_step_days: Optional[float] = None,
+    tol_days: float = DEFAULT_TOL_DAYS,
+    tol_deg: float = DEFAULT_TOL_DEG,
+) -> Dict[str, List[TransitHit]]:
+    """
+    Batch form over many natal vectors (key -> {point: lon}); one walk of the
+    body serves the whole cohort. E.g. all Jupiter returns:
+
+        search_cohort(lon_at, "Jupiter", {uid: {"Jupiter": lon} ...}, t0, t1, aspects=("conj",))
+    """
+    hits = _run(
+        lon_at, body, cohort, t0, t1,
+        aspects, max_speed, min_step_days, max_step_days, tol_days, tol_deg,
+    )
+    out: Dict[str, List[TransitHit]] = {key: [] for key in cohort}
+    for h in hits:
+        out[h.key].append(h)  # type: ignore[index]
+    return out